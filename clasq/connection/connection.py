@@ -98,10 +98,11 @@ class ConnectionABC:
         """ Run with multiple list of parameters """
         # Make QueryData
         qd = exprs[0] if len(exprs) == 1 and isinstance(exprs[0], QueryData) and not data else QueryData(*exprs)
-        # Make argument values iterator
-        iter_QueryArgVals = data.iter_rows_dict() if isinstance(data, TableData) else data
+        # Make parameters iterator (Rows of TableData are packed by their column positions)
+        if isinstance(data, TableData):
+            return self.run_stmt_many_prms(qd.stmt, qd.calc_prms_many_rows(data.columns, data.rows_values))
         # Run and handle result
-        return self.run_stmt_many_prms(qd.stmt, qd.calc_prms_many(iter_QueryArgVals))
+        return self.run_stmt_many_prms(qd.stmt, qd.calc_prms_many(data))
 
     @abstractmethod
     def commit(self) -> None:
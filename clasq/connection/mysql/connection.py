@@ -53,9 +53,7 @@ class MySQLConnectionABC(ConnectionABC):
         """ Execute a query with multiple lists of params and get result if exists
             (Override from `ConnectionABC`)
         """ 
-        pstmt = self._get_or_make_pstmt(stmt)
-        for prms in prms_list:
-            yield pstmt.run_with_params(prms)
+        return self._get_or_make_pstmt(stmt).run_many_with_params(prms_list)
 
     def run_stmt(self, stmt: bytes) -> TableData | None:
         """ Execute a query using prepared statement, and get result """
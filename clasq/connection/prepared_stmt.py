@@ -3,7 +3,7 @@
 """
 from __future__ import annotations
 from abc import abstractmethod
-from typing import Collection
+from typing import Collection, Iterable, Iterator
 
 from ..syntax.sql_values import SQLValue
 from ..utils.tabledata import TableData
@@ -40,10 +40,22 @@ class PreparedStatementExecutorABC:
         try:
             self.reset()
         except errors.ProgrammingError: # TODO: Check
-            self._stmt_id = self._new()
+            self._stmt_id, self.n_params = self._new()
 
     def run_with_params(self, params: Collection[SQLValue]) -> TableData | None:
         self.reset_or_new()
+        return self._check_and_send_params(params)
+
+    def run_many_with_params(self, params_list: Iterable[Collection[SQLValue]]) -> Iterator[TableData | None]:
+        """ Execute with each list of params
+            (The statement is reset only once before the first execution,
+             since no long data is sent and all results are read on each execution)
+        """
+        self.reset_or_new()
+        for params in params_list:
+            yield self._check_and_send_params(params)
+
+    def _check_and_send_params(self, params: Collection[SQLValue]) -> TableData | None:
         if not len(params) == self.n_params:
             raise errors.PreparedStatementPrametersError('Incorrect number of arguments for prepared statements.', self._stmt, len(params), self.n_params)
         return self._send_params(params)
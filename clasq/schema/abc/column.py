@@ -68,6 +68,10 @@ class TableColumnABC(NamedViewColumnABC):
     def table_or_none(self) -> Table | None:
         """ Get a parent Table object if exists """
 
+    @abstractproperty
+    def column_id(self) -> int:
+        """ Get a position of this column in the parent table """
+
     @abstractproperty
     def is_nullable(self) -> bool:
         """ is nullable or not """
@@ -3,7 +3,14 @@
 """
 from __future__ import annotations
 from abc import abstractmethod, abstractproperty
-from typing import TYPE_CHECKING, Collection, Iterable, Iterator, cast, overload
+import itertools
+import operator
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Iterator, cast, overload
 
 
 from ...syntax.abc.object import NameLike, ObjectABC, ObjectName
@@ -67,12 +74,43 @@ class DatabaseABC(ObjectABC):
         """ Get a table dict """
         raise NotImplementedError()
 
+    @abstractproperty
+    def _schema_cache_path(self) -> str | None:
+        """ Get a file path to cache the fetched schema (None if not cached) """
+        raise NotImplementedError()
+
+    @abstractproperty
+    def _schema_cache_ttl(self) -> float | None:
+        """ Get seconds to keep the fetched schema in memory (None if not kept) """
+        raise NotImplementedError()
+
+    @abstractproperty
+    def _tables_cache(self) -> dict[str, object]:
+        """ Get a cache of values derived from the tables
+            (Cleared when a table is appended or removed)
+        """
+        raise NotImplementedError()
+
+    @abstractproperty
+    def _name_cache(self) -> dict[str | bytes, TableABC]:
+        """ Get a cache of tables by their raw names
+            (Cleared when a table is appended or removed)
+        """
+        raise NotImplementedError()
+
+    def _clear_tables_cache(self) -> None:
+        """ Clear caches of the tables (Called when a table is appended or removed) """
+        self._tables_cache.clear()
+        self._name_cache.clear()
+
     def iter_tables(self):
         return iter(self._table_dict.values())
 
     @property
-    def all_tables(self):
-        return list(self.iter_tables())
+    def all_tables(self) -> tuple[TableABC, ...]:
+        if (tables := self._tables_cache.get('all_tables')) is None:
+            tables = self._tables_cache['all_tables'] = (*self._table_dict.values(),)
+        return cast(tuple[TableABC, ...], tables)
 
     def get_table(self, val: NameLike) -> TableABC:
         """ Get a Table object with the specified name
@@ -86,10 +124,17 @@ class DatabaseABC(ObjectABC):
         Returns:
             TableABC: Table object with the specified name
         """
+        # Only str and bytes names are cached (Other names may be unhashable)
+        if (type(val) is str or type(val) is bytes) and (table := self._name_cache.get(val)) is not None:
+            return table
         name = ObjectName(val)
-        if name not in self._table_dict:
+        if (table := self._table_dict.get(name)) is None:
             raise ObjectNotFoundError('Table not found.', name)
-        return self._table_dict[name]
+        if type(val) is str:
+            self._name_cache[sys.intern(val)] = table
+        elif type(val) is bytes:
+            self._name_cache[val] = table
+        return table
 
     @overload
     def __getitem__(self, val: NameLike) -> TableABC: ...
@@ -98,8 +143,14 @@ class DatabaseABC(ObjectABC):
     def __getitem__(self, val: tuple[NameLike, ...]) -> tuple[TableABC, ...]: ...
 
     def __getitem__(self, val):
-        if isinstance(val, tuple):
-            return (*(self.get_table(v) for v in val),)
+        if type(val) is tuple:
+            if len(val) > 1:
+                # Fast path if all the names are in the cache
+                try:
+                    return operator.itemgetter(*val)(self._name_cache)
+                except (KeyError, TypeError):
+                    pass
+            return tuple(map(self.get_table, val))
         return self.get_table(val)
 
     def get_table_or_none(self, val: NameLike) -> TableABC | None:
@@ -111,19 +162,17 @@ class DatabaseABC(ObjectABC):
         return None
 
     def _to_table(self, val: NameLike | TableABC) -> TableABC:
+        # Names are the most common arguments
+        if type(val) is str or type(val) is bytes or type(val) is ObjectName:
+            return self.get_table(val)
+        if isinstance(val, TableABC):
+            return self._table_object_to_table(val)
+        return self.get_table(val)
 
-        try:
-            is_table_abc = isinstance(val, TableABC)
-        except TypeError:
-            is_table_abc = False
-
-        if is_table_abc:
-            table = cast(TableABC, val)
-            if table._database == self:
-                return table
-            raise NotaSelfObjectError('Not a table of this database.')
-        
-        return self.get_table(cast(NameLike, val))
+    def _table_object_to_table(self, table: TableABC) -> TableABC:
+        if table._database is self or table._database == self:
+            return table
+        raise NotaSelfObjectError('Not a table of this database.')
 
     def _to_table_or_none(self, val: NameLike | TableABC) -> TableABC | None:
         try:
@@ -152,48 +201,198 @@ class DatabaseABC(ObjectABC):
     def append_table(self, arg1, /, *cols, **kwargs) -> TableABC:
         """ Append a new table to this Database """
 
-        try:
-            is_table_abc = isinstance(arg1, TableABC)
-        except TypeError:
-            is_table_abc = False
-
-        if is_table_abc:
-            return self.append_table_object(cast(TableABC, arg1))
-            
         if isinstance(arg1, TableArgs):
             table_arg = arg1
         else:
+            if isinstance(arg1, TableABC):
+                return self.append_table_object(arg1)
             table_arg = TableArgs(arg1, *cols, **kwargs)
         table = self._new_table(table_arg)
 
         table_name = table.get_name()
-        if table_name in self._table_dict:
+        if self._table_dict.setdefault(table_name, table) is not table:
             raise ObjectNameAlreadyExistsError('Table name object already exists.', table_name)
-
-        self._table_dict[table_name] = table
-        return self._table_dict[table_name]
+        self._clear_tables_cache()
+        return table
 
     def append_table_object(self, table: TableABC):
         if table._database is not self:
             raise NotaSelfObjectError('Not a table of this database.', table)
-        table_name = table.get_name()
-        if table_name in self._table_dict:
+        if self._table_dict.setdefault(table.get_name(), table) is not table:
             raise ObjectNameAlreadyExistsError('Table name object already exists.', table)
-        self._table_dict[table_name] = table
-        return self._table_dict[table_name]
-
-    def remove_table(self, table: TableABC) -> None:
-        table_name = self._to_table(table).get_name()
-        del self._table_dict[table_name]
+        self._clear_tables_cache()
+        return table
+
+    def _append_new_tables(self, table_args: Iterable[TableArgs]) -> None:
+        """ Make new tables and append them to this Database at once """
+        tables = {(table := self._new_table(table_arg)).get_name(): table for table_arg in table_args}
+        for table_name in tables:
+            if table_name in self._table_dict:
+                raise ObjectNameAlreadyExistsError('Table name object already exists.', table_name)
+        self._table_dict.update(tables)
+        self._clear_tables_cache()
+
+    def remove_table(self, table: NameLike | TableABC) -> None:
+        if isinstance(table, TableABC):
+            if table._database is not self and table._database != self:
+                raise NotaSelfObjectError('Not a table of this database.', table)
+            table_name = table.get_name()
+        else:
+            table_name = ObjectName(table)
+        if self._table_dict.pop(table_name, None) is None:
+            raise ObjectNotFoundError('Table not found.', table_name)
+        self._clear_tables_cache()
 
     def fetch_from_db(self) -> None:
-        """ Fetch tables of this database from the connection """
-        for tabledata in self.query(b'SHOW', b'TABLES'):
-            table_name = str(tabledata[0]).encode()
-            self.append_table(TableArgs(table_name, *(
-                ColumnArgs(coldata['Field'], AnySQLType)  # TODO: Fix type
-                for coldata in self.query(b'SHOW', b'COLUMNS', b'FROM', table_name)
-            )))
+        """ Fetch tables of this database from the connection
+            (Columns of all tables are fetched with a single query.
+             If the schema cache path is set, the fetched schema is reused
+             while the schema version of the database is not changed.
+             If the schema cache TTL is set, the fetched schema is also kept in memory
+             for the databases of the same server and name until it expires.)
+        """
+        schema = self._load_schema_memory_cache()
+        if schema is None:
+            if (cache_path := self._schema_cache_path) is None:
+                schema = self._fetch_schema()
+            else:
+                version = self._fetch_schema_version()
+                schema = self._load_schema_cache(cache_path, version)
+                if schema is None:
+                    schema = self._fetch_schema()
+                    self._store_schema_cache(cache_path, version, schema)
+            self._store_schema_memory_cache(schema)
+
+        self._append_new_tables(
+            TableArgs(table_name, *(
+                ColumnArgs(column_name, AnySQLType)  # TODO: Fix type
+                for column_name in column_names
+            ))
+            for table_name, column_names in schema
+        )
+
+    def _fetch_schema(self) -> list[tuple[bytes, list]]:
+        """ Fetch table names and their column names of this database """
+        tabledata = self.query(
+            b'SELECT', b'TABLE_NAME', b',', b'COLUMN_NAME',
+            b'FROM', b'information_schema.COLUMNS',
+            b'WHERE', b'TABLE_SCHEMA', b'=', b'DATABASE()',
+            b'ORDER', b'BY', b'TABLE_NAME', b',', b'ORDINAL_POSITION',
+        )
+        return [
+            (str(table_name).encode(), [column_name for _, column_name in rows])
+            for table_name, rows in itertools.groupby(tabledata.rows_values, key=operator.itemgetter(0))
+        ]
+
+    def _fetch_schema_version(self) -> tuple:
+        """ Fetch a digest of the columns of this database
+            (Changed when a table or a column is created, dropped, renamed or modified.
+             Not changed by data changes.)
+        """
+        tabledata = self.query(
+            b'SELECT', b'COUNT(*)', b',',
+            b'BIT_XOR(CAST(CONV(LEFT(MD5(CONCAT_WS(CHAR(0),'
+            b' TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, ORDINAL_POSITION)), 16), 16, 10) AS UNSIGNED))',
+            b'FROM', b'information_schema.COLUMNS',
+            b'WHERE', b'TABLE_SCHEMA', b'=', b'DATABASE()',
+        )
+        return tuple(tabledata.rows_values[0])
+
+    def _schema_cache_header(self, version: tuple) -> dict[str, Any]:
+        """ Get a header of the schema cache file which must match to use the cached schema """
+        return {
+            'server': [None if v is None else str(v) for v in self._schema_server_key()],
+            'database': self.get_raw_name().decode(),
+            'version': [None if v is None else str(v) for v in version],
+        }
+
+    def _load_schema_cache(self, cache_path: str, version: tuple) -> list[tuple[bytes, list]] | None:
+        """ Load the cached schema if it exists and is of the current version
+            (The cache file is JSON, so a broken or foreign file is just a cache miss)
+        """
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache['header'] != self._schema_cache_header(version):
+                return None
+            return [
+                (table_name.encode(), [str(column_name) for column_name in column_names])
+                for table_name, column_names in cache['tables']
+            ]
+        except Exception:
+            return None
+
+    def _store_schema_cache(self, cache_path: str, version: tuple, schema: list[tuple[bytes, list]]) -> None:
+        """ Store the schema to the cache file
+            (Written to a temporary file and replaced atomically. Skipped if the file cannot be written.)
+        """
+        cache = {
+            'header': self._schema_cache_header(version),
+            'tables': [
+                [table_name.decode(), [
+                    column_name.decode() if isinstance(column_name, bytes) else str(column_name)
+                    for column_name in column_names
+                ]]
+                for table_name, column_names in schema
+            ],
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(cache_path) or '.', prefix=os.path.basename(cache_path), suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except Exception:  # The schema cache is optional
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _schema_server_key(self) -> tuple:
+        """ Get a key of the database server of the connection """
+        cnx_options = self._con.cnx_options
+        return tuple(cnx_options.get(k) for k in ('host', 'port', 'unix_socket', 'user'))
+
+    def _schema_memory_cache_key(self) -> tuple | None:
+        """ Get a key of the schema kept in memory (None if the schema is not kept) """
+        if self._schema_cache_ttl is None:
+            return None
+        return (type(self._con), *self._schema_server_key(), self.get_raw_name())
+
+    def _load_schema_memory_cache(self) -> list[tuple[bytes, list]] | None:
+        """ Get the schema kept in memory if it exists and is not expired """
+        if (key := self._schema_memory_cache_key()) is None:
+            return None
+        if (entry := _SCHEMA_MEMORY_CACHE.get(key)) is None:
+            return None
+        fetched_at, schema = entry
+        if time.monotonic() - fetched_at >= cast(float, self._schema_cache_ttl):
+            del _SCHEMA_MEMORY_CACHE[key]
+            return None
+        return schema
+
+    def _store_schema_memory_cache(self, schema: list[tuple[bytes, list]]) -> None:
+        if (key := self._schema_memory_cache_key()) is not None:
+            _SCHEMA_MEMORY_CACHE[key] = (time.monotonic(), schema)
+
+    def _invalidate_schema_memory_cache(self) -> None:
+        """ Discard the schema kept in memory (Called when tables are created or dropped) """
+        if (key := self._schema_memory_cache_key()) is not None:
+            _SCHEMA_MEMORY_CACHE.pop(key, None)
+
+    def refresh_from_db(self) -> None:
+        """ Remove all tables and fetch them again from the connection
+            (The schema kept in memory is not used)
+        """
+        self._invalidate_schema_memory_cache()
+        self._table_dict.clear()
+        self._clear_tables_cache()
+        self.fetch_from_db()
 
     def _create_database_query(self, *, if_not_exists=False) -> tuple:
         return (
@@ -204,12 +403,18 @@ class DatabaseABC(ObjectABC):
             (b'COLLATE', Object(self._collate)) if self._collate else None,
         )
 
+    def _drop_database_query(self, *, if_exists=False) -> tuple:
+        return (
+            b'DROP', b'DATABASE',
+            (b'IF', b'EXISTS') if if_exists else None,
+            self,
+        )
+
     def drop(self, *, if_exists=False) -> None:
         """ Run DROP DATABASE query """
         if_exists = if_exists # or (not self.exists)
-        self.execute(
-            b'DROP', b'DATABASE',
-            (b'IF', b'EXISTS') if if_exists else None, self)
+        self.execute(*self._drop_database_query(if_exists=if_exists))
+        self._invalidate_schema_memory_cache()
         # self._exists = False
 
     def create(self, *, if_not_exists=False, drop_if_exists=False) -> None:
@@ -217,6 +422,7 @@ class DatabaseABC(ObjectABC):
         if drop_if_exists:
             self.drop(if_exists=True)
         self.execute(*self._create_database_query(if_not_exists=if_not_exists))
+        self._invalidate_schema_memory_cache()
         # self._exists = True
 
     def query(self, *exprs: QueryLike | None, prms: Collection[ValueType] = ()) -> TableData:
@@ -236,6 +442,11 @@ class DatabaseABC(ObjectABC):
 
 
 
+# Schemas fetched from the database servers, kept with their fetched times
+# (Used when the schema cache TTL of the database is set)
+_SCHEMA_MEMORY_CACHE: dict[tuple, tuple[float, list[tuple[bytes, list]]]] = {}
+
+
 class DatabaseReferenceABC(DatabaseABC):
     """ Database Reference abstract class """
 
@@ -273,3 +484,19 @@ class DatabaseReferenceABC(DatabaseABC):
     @property
     def _table_dict(self):
         return self._entity._table_dict
+
+    @property
+    def _schema_cache_path(self):
+        return self._entity._schema_cache_path
+
+    @property
+    def _schema_cache_ttl(self):
+        return self._entity._schema_cache_ttl
+
+    @property
+    def _tables_cache(self):
+        return self._entity._tables_cache
+
+    @property
+    def _name_cache(self):
+        return self._entity._name_cache
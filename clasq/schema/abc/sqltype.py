@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 from abc import ABC, ABCMeta, abstractmethod
+import inspect
 import typing
 
 from ...utils.generic_cls import bind_generic_args
@@ -10,6 +11,42 @@ from ...utils.generic_cls import bind_generic_args
 if typing.TYPE_CHECKING:
     from ...syntax.sql_values import SQLValue
 
+_NOT_CACHED = object()
+
+_T = typing.TypeVar('_T')
+
+class _cached_cls_property(typing.Generic[_T]):
+    """ Property of SQL type classes which value is cached for each class
+        (The values depend only on the class and its generic arguments)
+    """
+
+    def __init__(self, func: typing.Callable[[typing.Any], _T]) -> None:
+        self._func = func
+        self._attr = '_cached_' + func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, cls: typing.Any, owner: typing.Any = None) -> _T:
+        if cls is None:  # Accessed on the metaclass itself
+            return self  # type: ignore[return-value]
+        if (v := cls.__dict__.get(self._attr, _NOT_CACHED)) is _NOT_CACHED:
+            v = self._func(cls)
+            setattr(cls, self._attr, v)
+        return v
+
+    def __set__(self, cls: typing.Any, value: typing.Any) -> None:
+        # Read-only like `property` (Also keeps the precedence of a data descriptor)
+        raise AttributeError('Cannot set a cached class property.')
+
+def _generic_arg_value(arg: typing.Any) -> typing.Any:
+    """ Get a value of the generic argument (Unwrap `Literal`) """
+    if typing.get_origin(arg) is typing.Literal:
+        vals = typing.get_args(arg)
+        return vals[0] if len(vals) == 1 else vals
+    return arg
+
+def _no_conversion(v: typing.Any) -> typing.Any:
+    return v
+
 class _SQLTypeABCMeta(ABCMeta):
     """ SQL Type ABC Metaclass """
 
@@ -18,7 +55,7 @@ class _SQLTypeABCMeta(ABCMeta):
         """ Get a sql type name"""
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def sql_type_name(cls) -> bytes:
         return cls.get_sql_type_name()
 
@@ -27,38 +64,88 @@ class _SQLTypeABCMeta(ABCMeta):
         """ Get a python type """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def python_type(cls) -> typing.Type:
         return cls.get_python_type()
 
     def convert_value_for_sql(cls, v: typing.Any) -> SQLValue:
         """ Convert a value for SQL """
-        return v  # Default Implementation
+        for validate in cls.value_validators:
+            v = validate(v)
+        return v
+
+    def _make_value_validator(cls) -> typing.Callable[[typing.Any], SQLValue] | None:
+        """ Make a function to validate (and convert) a value for SQL
+            (Called for each metaclass in the MRO which defines this method)
+        """
+        return None  # Default Implementation
+
+    @_cached_cls_property
+    def value_validators(cls) -> tuple[typing.Callable[[typing.Any], SQLValue], ...]:
+        """ Get a tuple of value validators of the metaclasses (The base first)
+            (Collected per class on the first use, so `_make_value_validator` defined on a metaclass
+             after that is not applied to the class)
+        """
+        return tuple(
+            validate for meta in reversed(inspect.getmro(type(cls)))
+            if (make := meta.__dict__.get('_make_value_validator')) is not None
+            and (validate := make(cls)) is not None
+        )
+
+    @_cached_cls_property
+    def value_converter(cls) -> typing.Callable[[typing.Any], SQLValue]:
+        """ Get a function to convert a value for SQL
+            (Same as `convert_value_for_sql`, but specialized for this class)
+        """
+        if getattr(cls.convert_value_for_sql, '__func__', None) is not _SQLTypeABCMeta.convert_value_for_sql:
+            return cls.convert_value_for_sql  # Conversion is customized
+        validators = cls.value_validators
+        if not validators:
+            return _no_conversion
+        if len(validators) == 1:
+            return validators[0]
+        def _convert(v):
+            for validate in validators:
+                v = validate(v)
+            return v
+        return _convert
+
+    def __init__(cls, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Resolve generic arguments and their values once
+        # (None if the class is generic but the arguments are not bound)
+        cls._generic_args: tuple | None = ()
+        cls._generic_arg_values: tuple | None = ()
+        if hasattr(cls, '__orig_bases__'):
+            if hasattr(cls, '__orig_class__'):
+                cls._generic_args = typing.get_args(getattr(cls, '__orig_class__'))
+                cls._generic_arg_values = tuple(map(_generic_arg_value, cls._generic_args))
+            else:
+                cls._generic_args = cls._generic_arg_values = None
 
     def get_generic_args(cls) -> tuple:
         """ Get a tuple of generic arguments (if exists) """
-        if hasattr(cls, '__orig_bases__'):
-            if not hasattr(cls, '__orig_class__'):
-                raise RuntimeError('Cannot get generic arguments from a generic class variable.')
-            return typing.get_args(getattr(cls, '__orig_class__'))    
-        return ()
+        if (args := cls._generic_args) is None:
+            raise RuntimeError('Cannot get generic arguments from a generic class variable.')
+        return args
 
     def get_generic_arg(cls, i: int, default: typing.Any = None) -> typing.Any:
         """ Get a generic argument value of a specific index """
-        if len(args := cls.get_generic_args()) > i:
-            arg = args[i]
-            if typing.get_origin(arg) is typing.Literal:
-                vals = typing.get_args(arg)
-                return vals[0] if len(vals) == 1 else vals
-            return arg
-        return default
+        if (vals := cls._generic_arg_values) is None:
+            raise RuntimeError('Cannot get generic arguments from a generic class variable.')
+        return vals[i] if len(vals) > i else default
 
 class SQLTypeABC(ABC, metaclass=_SQLTypeABCMeta):
     """ SQL Type ABC """
 
+    # Concrete type classes do not declare `__slots__`, so their instances keep
+    # `__dict__` for `__orig_class__` which is set by generic aliases.
+    __slots__ = ('_orig_v', '_cls')
+
     def __init__(self, v) -> None:
         super().__init__()
         self._orig_v = v
+        self._cls: typing.Type[SQLTypeABC] | None = None
 
     @property
     def orig_value(self) -> SQLValue:
@@ -66,11 +153,14 @@ class SQLTypeABC(ABC, metaclass=_SQLTypeABCMeta):
 
     @property
     def cls(self) -> typing.Type['SQLTypeABC']:
-        return bind_generic_args(getattr(self, '__orig_class__', type(self)))
+        # Bound lazily since `__orig_class__` is set after `__init__` by the generic alias
+        if (cls := self._cls) is None:
+            cls = self._cls = bind_generic_args(getattr(self, '__orig_class__', type(self)))
+        return cls
 
     @property
     def sql_value(self) -> SQLValue:
-        return self.cls.convert_value_for_sql(self._orig_v)
+        return self.cls.value_converter(self._orig_v)
 
 
 class _WithParamsABCMeta(_SQLTypeABCMeta):
@@ -82,7 +172,7 @@ class _WithParamsABCMeta(_SQLTypeABCMeta):
         """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def base_sql_type_name(cls) -> bytes:
         return cls.get_base_sql_type_name()
 
@@ -91,13 +181,13 @@ class _WithParamsABCMeta(_SQLTypeABCMeta):
         """ Get a tuple of parameter values for sql type name """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def params_for_sql_type_name(cls) -> tuple:
         return cls.get_params_for_sql_type_name()
 
     def get_sql_type_name(cls) -> bytes:
         if params := cls.params_for_sql_type_name:
-            return b'%s(%s)' % (cls.base_sql_type_name, ', '.join(map(str, params)).encode())
+            return b'%s(%s)' % (cls.base_sql_type_name, b', '.join(b'%d' % p for p in params))
         return cls.base_sql_type_name
 
 class _NumericABCMeta(_SQLTypeABCMeta):
@@ -114,7 +204,7 @@ class _IntegerABCMeta(_NumericABCMeta):
         """ Get a minimum value """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def min_value(cls) -> int:
         return cls.get_min_value()
 
@@ -123,18 +213,25 @@ class _IntegerABCMeta(_NumericABCMeta):
         """ Get a minimum value """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def max_value(cls) -> int:
         return cls.get_max_value()
 
     def get_python_type(cls) -> typing.Type:
         return int
 
-    def convert_value_for_sql(cls, v):
-        v = super().convert_value_for_sql(v)
-        if not (cls.min_value <= v and v <= cls.max_value):
-            raise ValueError('Out of range of integer.', v)
-        return v
+    @_cached_cls_property
+    def value_range(cls) -> tuple[int, int]:
+        """ Get a tuple of the minimum and maximum values """
+        return (cls.min_value, cls.max_value)
+
+    def _make_value_validator(cls) -> typing.Callable[[typing.Any], SQLValue] | None:
+        min_value, max_value = cls.value_range
+        def _validate(v):
+            if not (min_value <= v <= max_value):
+                raise ValueError('Out of range of integer.', v)
+            return v
+        return _validate
 
 class IntegerABC(NumericABC, metaclass=_IntegerABCMeta):
     """ Integer type ABC """
@@ -147,15 +244,15 @@ class _UnsignedIntegerABCMeta(_IntegerABCMeta):
         """ Get a base signed integer type """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def signed_type(cls) -> typing.Type[IntegerABC]:
         return cls.get_signed_type()
 
     def get_sql_type_name(cls) -> bytes:
-        return b'%s UNSIGNED' % cls.get_signed_type().get_sql_type_name()
+        return b'%s UNSIGNED' % cls.signed_type.sql_type_name
 
     def get_max_value(cls) -> int:
-        signed_type = cls.get_signed_type()
+        signed_type = cls.signed_type
         return -signed_type.min_value + signed_type.max_value
     
     def get_min_value(cls) -> int:
@@ -181,7 +278,7 @@ class _DecimalABCMeta(_NumericABCMeta, _WithParamsABCMeta):
             raise RuntimeError('Precision is not set.')
         return int(v)
 
-    @property
+    @_cached_cls_property
     def prec(cls):
         return cls.get_prec()
 
@@ -190,7 +287,7 @@ class _DecimalABCMeta(_NumericABCMeta, _WithParamsABCMeta):
             raise RuntimeError('Scale is not set.')
         return int(v)
 
-    @property
+    @_cached_cls_property
     def scale(cls):
         return cls.get_scale()
 
@@ -217,15 +314,18 @@ class _StringABCMeta(_SQLTypeABCMeta):
         """ Get a max length """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def max_length(cls) -> int | None:
         return cls.get_max_length()
         
-    def convert_value_for_sql(cls, v):
-        v = super().convert_value_for_sql(v)
-        if not ((lmax := cls.get_max_length()) is None or len(v) <= lmax):
-            raise ValueError('The length of a value exceeds the limit.', v)
-        return v
+    def _make_value_validator(cls) -> typing.Callable[[typing.Any], SQLValue] | None:
+        if (lmax := cls.max_length) is None:
+            return None
+        def _validate(v):
+            if len(v) > lmax:
+                raise ValueError('The length of a value exceeds the limit.', v)
+            return v
+        return _validate
 
 class StringABC(SQLTypeABC, metaclass=_StringABCMeta):
     """ String type ABC """
@@ -248,7 +348,7 @@ class _WithLengthABCMeta(_WithParamsABCMeta):
     def get_specified_length(cls) -> int | None:
         return int(v) if (v := cls.get_generic_arg(0)) is not None else None
 
-    @property
+    @_cached_cls_property
     def specified_length(cls) -> int | None:
         return cls.get_specified_length()
 
@@ -260,7 +360,7 @@ class _WithLengthABCMeta(_WithParamsABCMeta):
             raise TypeError('Invalid type of length.', v)
         return v
 
-    @property
+    @_cached_cls_property
     def length(cls) -> int:
         return cls.get_length()
 
@@ -279,7 +379,7 @@ class _WithOptionalLengthABCMeta(_WithLengthABCMeta):
         """ Get a default length """
         raise NotImplementedError()
 
-    @property
+    @_cached_cls_property
     def default_length(cls) -> int:
         return cls.get_default_length()
 
@@ -293,15 +393,17 @@ L = typing.TypeVar('L', bound=int)
 class _BitABCMeta(_NumericABCMeta, _WithLengthABCMeta):
     """ Bit type """
 
-    def convert_value_for_sql(cls, v: typing.Any) -> SQLValue:
-        v = super().convert_value_for_sql(v)
-        if v is None or v is True or v is False:
-            return v
-        if isinstance(v, int):
-            if v < 2**cls.length:
+    def _make_value_validator(cls) -> typing.Callable[[typing.Any], SQLValue] | None:
+        upper = 1 << cls.length
+        def _validate(v):
+            if v is None or v is True or v is False:
                 return v
-            raise ValueError('Data too long.', v)
-        raise TypeError('Invalid type.', v)
+            if isinstance(v, int):
+                if v < upper:
+                    return v
+                raise ValueError('Data too long.', v)
+            raise TypeError('Invalid type.', v)
+        return _validate
 
 class BitABC(NumericABC, typing.Generic[L], metaclass=_BitABCMeta):
     """ SQL type with required length ABC for Bit """
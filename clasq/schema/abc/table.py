@@ -2,10 +2,11 @@
     Table abstract classes
 """
 from abc import abstractmethod, abstractproperty
-from typing import Iterator
+import itertools
+from typing import Iterator, Sequence, TypeVar, cast
 
 from ...syntax.abc.object import ObjectName
-from ...syntax.exprs import OP, Arg, ExprABC, NameLike
+from ...syntax.exprs import Arg, ExprABC, NameLike, NoneExpr
 from ...syntax.values import ValueType
 from ...syntax.query_data import QueryData
 from ...syntax.errors import ObjectNotFoundError
@@ -15,6 +16,29 @@ from ..fkey_ref import ForeignKeyReference
 from .view import NamedViewABC, ViewReferenceABC
 
 
+_T = TypeVar('_T')
+
+# Max number of placeholders in a prepared statement
+_MAX_PLACEHOLDERS = 65535
+
+# Positional query arguments shared by the query templates
+_POSITIONAL_ARGS: list[Arg] = []
+
+
+def _positional_args(n: int) -> list[Arg]:
+    """ Get positional query arguments `Arg(0)` ... `Arg(n - 1)`
+        (Arg objects are shared since they are not changed after creation)
+    """
+    if (n_args := len(_POSITIONAL_ARGS)) < n:
+        _POSITIONAL_ARGS.extend(Arg(i) for i in range(n_args, n))
+    return _POSITIONAL_ARGS[:n]
+
+
+def _hashable_value(v: object) -> object:
+    """ Convert an unhashable value to a hashable value which is equal in SQL """
+    return bytes(v) if isinstance(v, bytearray) else v
+
+
 class TableArgs:
     """ Table Expr """
 
@@ -35,6 +59,8 @@ class TableArgs:
 
 class TableABC(NamedViewABC):
     """ Table Expr """
+
+    DATA_ROWS_LIMIT = 1000
     
     @abstractproperty
     def _primary_keys(self):
@@ -44,6 +70,34 @@ class TableABC(NamedViewABC):
     def _unique_columns(self):
         """ Get a unique columns """
 
+    @abstractproperty
+    def _query_cache(self) -> dict[tuple, QueryData]:
+        """ Get a cache of query data templates of this table """
+
+    @abstractproperty
+    def _table_columns(self) -> tuple[TableColumn, ...]:
+        """ Get a tuple of table columns """
+
+    @abstractproperty
+    def _column_name_cache(self) -> dict[str | bytes, TableColumn]:
+        """ Get a dictionary from str and bytes column names to table columns """
+
+    @abstractproperty
+    def _data_columns_cache(self) -> dict[tuple, tuple[TableColumn, ...]]:
+        """ Get a dictionary from TableData column names to table columns """
+
+    @property
+    @abstractmethod
+    def _exists_on_db(self) -> bool | None:
+        """ Get if this table exists on the database (None if unknown)
+            (Last known state in this process, only for diagnostics)
+        """
+
+    @_exists_on_db.setter
+    @abstractmethod
+    def _exists_on_db(self, exists: bool | None) -> None:
+        """ Set if this table exists on the database """
+
     def _refresh_select_from_query(self) -> None:
         pass  # Do nothing
 
@@ -51,20 +105,36 @@ class TableABC(NamedViewABC):
         """ Iterate table columns
             (Override from `TableABC`)
         """
-        for col in self._base_column_set:
-            assert isinstance(col, TableColumn)
-            yield col
-
-    def get_table_column(self, val: TableColumn | NameLike) -> TableColumn:
+        return iter(self._table_columns)
+
+    def get_table_column(self, val: TableColumn | NameLike | int) -> TableColumn:
+        # Column names are the most common arguments
+        if (type(val) is str or type(val) is bytes) and (col := self._column_name_cache.get(val)) is not None:
+            return col
+        if type(val) is ObjectName and (col := self._column_name_cache.get(val.raw_name)) is not None:
+            return col
+        # Column IDs are positions of the columns
+        if type(val) is int:
+            if not 0 <= val < len(self._table_columns):
+                raise ObjectNotFoundError('Column not found.', val)
+            return self._table_columns[val]
         if isinstance(val, TableColumn):
             if val.table_or_none is not self:
                 raise ObjectNotFoundError('Column of the different table.', val)
             return val
-        key = ObjectName(val)
-        if key not in self._base_column_set:
-            raise ObjectNotFoundError('Column not found.', key)
-        assert isinstance(col := self._base_column_set[key], TableColumn)
-        return col
+        # Base columns are keyed by their names with the table name
+        if (base_col := self._base_column_set.get(self._view_name + ObjectName(cast(NameLike, val)))) is None:
+            raise ObjectNotFoundError('Column not found.', val)
+        assert isinstance(base_col, TableColumn)
+        return base_col
+
+    def _get_data_columns(self, names: tuple[NameLike | TableColumn, ...]) -> tuple[TableColumn, ...]:
+        """ Get table columns of TableData or column-value argument names
+            (Resolved once per column names)
+        """
+        if (cols := self._data_columns_cache.get(names)) is None:
+            cols = self._data_columns_cache[names] = tuple(self.get_table_column(name) for name in names)
+        return cols
 
     def append_to_query_data(self, qd: QueryData) -> None:
         """ Append a query of this table 
@@ -77,11 +147,15 @@ class TableABC(NamedViewABC):
         """ Get a query of this table for SELECT FROM 
             (Override from `BaseViewABC`)
         """
-        return QueryData(self)
+        if not (qd := self._query_cache.get((b'FROM',))):
+            qd = self._query_cache[(b'FROM',)] = QueryData(self)
+        return qd
 
     @property
     def _query_for_select_column(self) -> QueryData:
-        return QueryData(self, b'.*')
+        if not (qd := self._query_cache.get((b'.*',))):
+            qd = self._query_cache[(b'.*',)] = QueryData(self, b'.*')
+        return qd
 
     def select(self, *exprs, **options) -> TableData:
         """ Run SELECT query """
@@ -98,22 +172,64 @@ class TableABC(NamedViewABC):
             int: Last inserted row ID
         """
         column_values = self._proc_colval_args(data, **values)
-        self._con.execute(
-            b'INSERT', b'INTO', self, b'(', column_values.keys(), b')',
-            b'VALUES', b'(', column_values.values(),  b')',
-        )
+        columns = tuple(c for c, _ in column_values)
+        vals = [v for _, v in column_values]
+        if any(isinstance(v, ExprABC) for v in vals):
+            self._con.execute(
+                b'INSERT', b'INTO', self, b'(', [*columns], b')',
+                b'VALUES', b'(', vals,  b')',
+            )
+        else:
+            self._con.execute(self._get_insert_query(columns).call_positional(vals))
         return self._con.last_row_id()
 
+    def _get_insert_query(self, columns: tuple[TableColumn, ...]) -> QueryData:
+        """ Get a INSERT query template for the columns
+            (Values are positional query arguments)
+        """
+        key = (b'INSERT', tuple(c.column_id for c in columns))
+        if not (qd := self._query_cache.get(key)):
+            qd = self._query_cache[key] = QueryData(
+                b'INSERT', b'INTO', self, b'(', [*columns], b')',
+                b'VALUES', b'(', _positional_args(len(columns)), b')',
+            )
+        return qd
+
     def insert_data(self, data: TableData[ValueType]) -> int:
-        """ Run INSERT with TableData """
-        name_and_col = [(name, self._to_column(name)) for name in data.columns]
-        self._con.execute_many(
-            b'INSERT', b'INTO', self, b'(', [col for _, col in name_and_col], b')',
-            b'VALUES', b'(', [Arg(name) for name, _ in name_and_col],  b')',
-            data=data
-        )
+        """ Run INSERT with TableData
+            (Rows are inserted by multi-row INSERT queries of at most `DATA_ROWS_LIMIT` rows)
+        """
+        columns = self._get_data_columns(data.columns)
+        for rows, is_full in self._iter_data_row_chunks(data.rows_values, len(columns)):
+            self._con.execute(
+                self._get_insert_rows_query(columns, len(rows), cache=is_full)
+                .call_positional([*itertools.chain.from_iterable(rows)]))
         return self._con.last_row_id()
 
+    def _iter_data_row_chunks(self, rows: Sequence[_T], n_prms_per_row: int) -> Iterator[tuple[Sequence[_T], bool]]:
+        """ Split rows into chunks for multi-row queries
+            (Yields a chunk and whether it has the full number of rows)
+        """
+        n_rows = max(1, min(self.DATA_ROWS_LIMIT, _MAX_PLACEHOLDERS // max(1, n_prms_per_row)))
+        for i in range(0, len(rows), n_rows):
+            chunk = rows[i:i + n_rows]
+            yield chunk, len(chunk) == n_rows
+
+    def _get_insert_rows_query(self, columns: tuple[TableColumn, ...], n_rows: int, *, cache=True) -> QueryData:
+        """ Get a multi-row INSERT query template for the columns
+            (Values are positional query arguments in row-major order)
+        """
+        key = (b'INSERT', n_rows, tuple(c.column_id for c in columns))
+        if not (qd := self._query_cache.get(key)):
+            n_cols = len(columns)
+            qd = QueryData(
+                b'INSERT', b'INTO', self, b'(', [*columns], b')',
+                b'VALUES', self._rows_values_query(n_cols, n_rows),
+            )
+            if cache:
+                self._query_cache[key] = qd
+        return qd
+
     def update(self,
         data: dict[NameLike | TableColumn, ValueType] | None = None,
         *,
@@ -125,25 +241,116 @@ class TableABC(NamedViewABC):
         """ Run UPDATE query """
 
         column_values = self._proc_colval_args(data, **values)
+        vals = [v for _, v in column_values]
+        if any(isinstance(v, ExprABC) for v in vals):
+            set_query: QueryData = QueryData(
+                b'UPDATE', self, b'SET', [(c, b'=', v) for c, v in column_values])
+        else:
+            set_query = self._get_update_set_query(tuple(c for c, _ in column_values)).call_positional(vals)
         self._con.execute(
-            b'UPDATE', self, b'SET', [(c, b'=', v) for c, v in column_values.items()],
-            (b'WHERE', where) if where else None,
+            set_query,
+            (b'WHERE', where) if where is not None and where is not NoneExpr else None,
             (b'ORDER', b'BY', [c.ordered_query for c in orders]) if orders else None,
             (b'LIMIT', limit) if limit else None,
         )
 
+    def _get_update_set_query(self, columns: tuple[TableColumn, ...]) -> QueryData:
+        """ Get a UPDATE ... SET query template for the columns
+            (Values are positional query arguments)
+        """
+        key = (b'UPDATE', tuple(c.column_id for c in columns))
+        if not (qd := self._query_cache.get(key)):
+            qd = self._query_cache[key] = QueryData(
+                b'UPDATE', self, b'SET', [(c, b'=', arg) for c, arg in zip(columns, _positional_args(len(columns)))])
+        return qd
+
     def update_data(self, data: TableData[ValueType], keys: list[NameLike | TableColumn]) -> None:
-        """ Run UPDATE query with TableData """
-        data_name_and_col = [(c, self._to_column(c)) for c in data.columns if c not in keys]
-        key_name_and_col  = [(c, self._to_column(c)) for c in data.columns if c in keys]
-        if not (len(data_name_and_col) + len(key_name_and_col) == len(data.columns)):
+        """ Run UPDATE with TableData
+            (Rows are updated by UPDATE ... JOIN (SELECT ... UNION ALL ...) queries of at most `DATA_ROWS_LIMIT` rows.
+             The last row is used for duplicate keys. Key values must be hashable except bytearray.)
+        """
+        columns = self._get_data_columns(data.columns)
+        key_ids = frozenset(self.get_table_column(k).column_id for k in keys)
+        data_indexes: list[int] = []
+        key_indexes: list[int] = []
+        for i, col in enumerate(columns):
+            (key_indexes if col.column_id in key_ids else data_indexes).append(i)
+        if not (len(key_indexes) == len(key_ids)):
             raise ValueError('Invalid key values.')
-        
-        self._con.execute_many(
-            b'UPDATE', self, b'SET', [(col, b'=', Arg(name)) for name, col in data_name_and_col],
-            b'WHERE', OP.AND(col == Arg(name) for name, col in key_name_and_col),
-            data=data
-        )
+        if not key_indexes or not data_indexes:
+            raise ValueError('Both key and non-key columns are required.')
+
+        key_cols = tuple(columns[i] for i in key_indexes)
+        data_cols = tuple(columns[i] for i in data_indexes)
+
+        # Key values first, then data values. The last row wins for duplicate keys.
+        rows: list[tuple[tuple, tuple]]
+        try:
+            rows = list({
+                tuple(row[i] for i in key_indexes): tuple(row[i] for i in data_indexes)
+                for row in data.rows_values
+            }.items())
+        except TypeError:  # Unhashable key values (bytearray) are compared as bytes
+            rows = list({
+                tuple(_hashable_value(row[i]) for i in key_indexes): tuple(row[i] for i in data_indexes)
+                for row in data.rows_values
+            }.items())
+        for chunk, is_full in self._iter_data_row_chunks(rows, len(columns)):
+            self._con.execute(
+                self._get_update_rows_query(key_cols, data_cols, len(chunk), cache=is_full)
+                .call_positional([*itertools.chain.from_iterable(k + v for k, v in chunk)]))
+
+    def _get_update_rows_query(self,
+        key_cols: tuple[TableColumn, ...],
+        data_cols: tuple[TableColumn, ...],
+        n_rows: int,
+        *,
+        cache=True,
+    ) -> QueryData:
+        """ Get a multi-row UPDATE query template for the key and data columns
+            (The table is joined with the rows on the key columns, so the query grows linearly with the rows.
+             Key values and data values of each row are positional query arguments in row-major order)
+        """
+        key = (b'UPDATE', n_rows, tuple(c.column_id for c in key_cols), tuple(c.column_id for c in data_cols))
+        if not (qd := self._query_cache.get(key)):
+            rows_name = ObjectName(self.get_raw_name() + b'_data')  # Differs from the table name
+            on_query: list = []
+            for col in key_cols:
+                if on_query:
+                    on_query.append(b'AND')
+                on_query.append((col, b'=', rows_name, b'.', col.name))
+            qd = QueryData(
+                b'UPDATE', self,
+                b'INNER', b'JOIN', b'(', self._rows_select_query((*key_cols, *data_cols), n_rows), b')',
+                b'AS', rows_name, b'ON', tuple(on_query),
+                b'SET', [(col, b'=', rows_name, b'.', col.name) for col in data_cols],
+            )
+            if cache:
+                self._query_cache[key] = qd
+        return qd
+
+    def _rows_select_query(self, columns: tuple[TableColumn, ...], n_rows: int) -> QueryData:
+        """ Make a `SELECT ? AS col, ... UNION ALL SELECT ?, ... ...` query
+            whose values are positional query arguments in row-major order
+            (The statement of the rows except the first one is rendered once and repeated)
+        """
+        n_cols = len(columns)
+        args = _positional_args(n_cols * n_rows)
+        first_stmt = QueryData(b'SELECT', [(arg, b'AS', col.name) for arg, col in zip(args, columns)]).stmt
+        row_stmt = QueryData(b'SELECT', args[:n_cols]).stmt
+        return QueryData(stmt=b' UNION ALL '.join([first_stmt, *[row_stmt] * (n_rows - 1)]), args=args, prms=args)
+
+    def _rows_values_query(self, n_cols: int, n_rows: int) -> QueryData:
+        """ Make a `(?, ...), (?, ...), ...` query whose values are positional query arguments in row-major order
+            (The statement of a row is rendered once and repeated)
+        """
+        row_stmt = QueryData(b'(', _positional_args(n_cols), b')').stmt
+        args = _positional_args(n_cols * n_rows)
+        return QueryData(stmt=b', '.join([row_stmt] * n_rows), args=args, prms=args)
+
+    def _rows_in_query(self, columns: tuple[TableColumn, ...], n_rows: int) -> tuple:
+        """ Make a `(columns) IN ((...), ...)` condition whose values are positional query arguments """
+        return (b'(', [*columns], b')', b'IN', b'(', self._rows_values_query(len(columns), n_rows), b')')
 
     def delete(self, *,
         where: ExprABC | None,
@@ -151,41 +358,83 @@ class TableABC(NamedViewABC):
         limit: int | None = None,
     ) -> None:
         """ Run DELETE query """
+        if not (qd := self._query_cache.get((b'DELETE',))):
+            qd = self._query_cache[(b'DELETE',)] = QueryData(b'DELETE', b'FROM', self)
         self._con.execute(
-            b'DELETE', b'FROM', self,
-            (b'WHERE', where) if where else None,
+            qd,
+            (b'WHERE', where) if where is not None and where is not NoneExpr else None,
             (b'ORDER', b'BY', [c.ordered_query for c in orders]) if orders else None,
             (b'LIMIT', limit) if limit else None,
         )
 
     def delete_data(self, data: TableData[ValueType]) -> int:
-        """ Run DELETE with TableData """
-        name_and_col = [(name, self._to_column(name)) for name in data.columns]
-        self._con.execute_many(
-            b'DELETE', b'FROM', self,
-            b'WHERE', OP.AND(col == Arg(name) for name, col in name_and_col),
-            data=data
-        )
+        """ Run DELETE with TableData
+            (Rows are deleted by DELETE ... WHERE (columns) IN (...) queries of at most `DATA_ROWS_LIMIT` rows)
+        """
+        columns = self._get_data_columns(data.columns)
+        for rows, is_full in self._iter_data_row_chunks(data.rows_values, len(columns)):
+            self._con.execute(
+                self._get_delete_rows_query(columns, len(rows), cache=is_full)
+                .call_positional([*itertools.chain.from_iterable(rows)]))
         return self._con.last_row_id()
 
+    def _get_delete_rows_query(self, columns: tuple[TableColumn, ...], n_rows: int, *, cache=True) -> QueryData:
+        """ Get a multi-row DELETE query template for the columns
+            (Values are positional query arguments in row-major order)
+        """
+        key = (b'DELETE', n_rows, tuple(c.column_id for c in columns))
+        if not (qd := self._query_cache.get(key)):
+            qd = QueryData(b'DELETE', b'FROM', self, b'WHERE', self._rows_in_query(columns, n_rows))
+            if cache:
+                self._query_cache[key] = qd
+        return qd
+
     def truncate(self) -> None:
         """ Run TRUNCATE TABLE query """
-        self.db.execute(b'TRUNCATE', b'TABLE', self)
+        if not (qd := self._query_cache.get((b'TRUNCATE',))):
+            qd = self._query_cache[(b'TRUNCATE',)] = QueryData(b'TRUNCATE', b'TABLE', self)
+        self.db.execute(qd)
 
     def drop(self, *, temporary=False, if_exists=False) -> None:
-        """ Run DROP TABLE query """
-        self.db.execute(
-            b'DROP', b'TEMPORARY' if temporary else None, b'TABLE',
-            (b'IF', b'EXISTS') if if_exists else None, self)
-        # self._exists_on_db = False
+        """ Run DROP TABLE query and remove this table from the database object """
+        self._drop_on_db(temporary=temporary, if_exists=if_exists)
         self.db.remove_table(self)
 
+    def _drop_on_db(self, *, temporary=False, if_exists=False) -> None:
+        """ Run DROP TABLE query """
+        key = (b'DROP', bool(temporary), bool(if_exists))
+        if not (qd := self._query_cache.get(key)):
+            qd = self._query_cache[key] = QueryData(
+                b'DROP', b'TEMPORARY' if temporary else None, b'TABLE',
+                (b'IF', b'EXISTS') if if_exists else None, self)
+        self.db.execute(qd)
+        self._exists_on_db = False
+        self.db._invalidate_schema_memory_cache()
+
     def get_create_table_query(self, *, temporary=False, if_not_exists=False) -> QueryData:
-        return QueryData(
-            b'CREATE', b'TEMPORARY' if temporary else None, b'TABLE',
-            b'IF NOT EXISTS' if if_not_exists else None,
-            self, b'(', [c.query_for_create_table for c in self.iter_table_columns()], b')'
-        )
+        return QueryData(self._get_create_table_query(temporary=temporary, if_not_exists=if_not_exists))
+
+    def _get_create_table_query(self, *, temporary=False, if_not_exists=False) -> QueryData:
+        """ Get a CREATE TABLE query
+            (Cached since the columns of a table do not change, so do not modify the result)
+        """
+        key = (b'CREATE', bool(temporary), bool(if_not_exists))
+        if not (qd := self._query_cache.get(key)):
+            qd = self._query_cache[key] = QueryData(
+                b'CREATE', b'TEMPORARY' if temporary else None, b'TABLE',
+                b'IF NOT EXISTS' if if_not_exists else None,
+                self, self._get_create_table_columns_query(),
+            )
+        return qd
+
+    def _get_create_table_columns_query(self) -> QueryData:
+        """ Get a column definitions part of CREATE TABLE query
+            (Cached since the columns of a table do not change)
+        """
+        if not (qd := self._query_cache.get((b'CREATE',))):
+            qd = self._query_cache[(b'CREATE',)] = QueryData(
+                b'(', [c.query_for_create_table for c in self._table_columns], b')')
+        return qd
     
     @property
     def create_table_query(self) -> QueryData:
@@ -194,15 +443,29 @@ class TableABC(NamedViewABC):
     def create(self, *, temporary=False, if_not_exists=False, drop_if_exists=False) -> None:
         """ Create this Table on the database """
         if drop_if_exists:
-            self.drop(temporary=temporary, if_exists=True)
-        self.db.execute(self.get_create_table_query(temporary=temporary, if_not_exists=if_not_exists))
+            self._drop_on_db(temporary=temporary, if_exists=True)
+        self.db.execute(self._get_create_table_query(temporary=temporary, if_not_exists=if_not_exists))
+        self._exists_on_db = True
+        self.db._invalidate_schema_memory_cache()
         # TODO: Fetch
 
     def __repr__(self) -> str:
         return 'T(%s)' % self.get_name()
         
-    def _proc_colval_args(self, value_dict: dict[NameLike | TableColumn, ValueType] | None, **values: ValueType) -> dict[TableColumn, ValueType]:
-        return {self.get_table_column(c): v for c, v in [*(value_dict.items() if value_dict else []), *values.items()]}
+    def _proc_colval_args(self, value_dict: dict[NameLike | TableColumn, ValueType] | None, **values: ValueType) -> list[tuple[TableColumn, ValueType]]:
+        """ Resolve columns of the column-value arguments
+            (The latter value is used if the same column is specified more than once)
+        """
+        if value_dict:
+            names = (*value_dict, *values)
+            vals = (*value_dict.values(), *values.values())
+        else:
+            names = (*values,)
+            vals = (*values.values(),)
+        columns = self._get_data_columns(names)
+        column_values: dict[int, tuple[TableColumn, ValueType]] = {
+            column.column_id: (column, v) for column, v in zip(columns, vals)}
+        return [*column_values.values()]
 
 
 class TableReferenceABC(ViewReferenceABC, TableABC):
@@ -238,3 +501,32 @@ class TableReferenceABC(ViewReferenceABC, TableABC):
     def _unique_columns(self):
         """ Override for `TableABC` """
         return self._entity._unique_columns
+
+    @property
+    def _query_cache(self):
+        """ Override for `TableABC` """
+        return self._entity._query_cache
+
+    @property
+    def _table_columns(self):
+        """ Override for `TableABC` """
+        return self._entity._table_columns
+
+    @property
+    def _column_name_cache(self):
+        """ Override for `TableABC` """
+        return self._entity._column_name_cache
+
+    @property
+    def _data_columns_cache(self):
+        """ Override for `TableABC` """
+        return self._entity._data_columns_cache
+
+    @property
+    def _exists_on_db(self):
+        """ Override for `TableABC` """
+        return self._entity._exists_on_db
+
+    @_exists_on_db.setter
+    def _exists_on_db(self, exists: bool | None):
+        self._entity._exists_on_db = exists
@@ -3,12 +3,11 @@
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod, abstractproperty
-import itertools
-from typing import TYPE_CHECKING, Iterable, overload
+from typing import TYPE_CHECKING, Iterable, Iterator, overload
 
 from ...syntax.abc.object import NameLike, ObjectABC, ObjectName
 from ...syntax.query_data import QueryData
-from ...syntax.exprs import AliasedExpr, ExprABC, ExprLike, ExprObjectABC, ExprObjectSet, FrozenExprObjectSet, FrozenOrderedExprObjectSet, NoneExpr, OP
+from ...syntax.exprs import ExprABC, ExprLike, ExprObjectABC, ExprObjectSet, FrozenExprObjectSet, FrozenOrderedExprObjectSet, NoneExpr, OP
 from ...syntax.keywords import JoinType, JoinLike, OrderTypeLike
 from ...syntax.errors import NotaSelfObjectError, ObjectArgTypeError, ObjectNotFoundError, ObjectNotSetError
 from ...utils.tabledata import TableData
@@ -25,6 +24,9 @@ ColumnArgTypes = ExprObjectSet | FrozenExprObjectSet | ExprObjectABC | NameLike
 _OrderedColumnWithAlias = tuple[NameLike | ExprObjectABC, OrderTypeLike]
 OrderedColumnArgTypes = NameLike | ExprObjectABC | _OrderedColumnWithAlias
 
+# Empty expression set shared by the views without groups or orders
+_EMPTY_EXPR_SET = FrozenOrderedExprObjectSet()
+
 class ViewABC(ABC):
     """ View Expr """
 
@@ -64,7 +66,7 @@ class ViewABC(ABC):
 
     @property
     def _column_alias_format(self) -> ObjectName:
-        return self._base_name + '_%s'
+        return self._base_name + b'_%s'
 
     @abstractproperty
     def _base_column_set(self) -> FrozenOrderedNamedViewColumnSet:
@@ -105,9 +107,9 @@ class ViewABC(ABC):
             Raises:
                 ObjectNotSetError: The database is not set.
         """
-        if self._database_or_none is None:
+        if (database := self._database_or_none) is None:
             raise ObjectNotSetError('Database is not set.')
-        return self._database_or_none
+        return database
 
     @property
     def db(self) -> DatabaseABC:
@@ -195,10 +197,10 @@ class ViewABC(ABC):
         Returns:
             ViewColumn: Column object with the specified name
         """
-        name = ObjectName(val)
-        if name not in self._selected_exprs:
-            raise ObjectNotFoundError('Column not found.', name)
-        return self._selected_exprs[name]
+        key = val.encode() if isinstance(val, str) else val # ObjectName hashes and compares as its raw bytes
+        if (col := self._selected_exprs.get(key)) is None:
+            raise ObjectNotFoundError('Column not found.', ObjectName(val))
+        return col
 
 
     def get_selected_column_or_none(self, val: NameLike) -> ExprObjectABC | None:
@@ -221,12 +223,12 @@ class ViewABC(ABC):
         Returns:
             ViewColumn: Column object with the specified name
         """
-        name = ObjectName(val)
-        if name in self._selected_exprs:
-            return self._selected_exprs[name]
-        if name in self._base_column_set:
-            return self._base_column_set[name]
-        raise ObjectNotFoundError('Column not found.', name)
+        key = val.encode() if isinstance(val, str) else val
+        if (col := self._selected_exprs.get(key)) is not None:
+            return col
+        if (col := self._base_column_set.get(key)) is not None:
+            return col
+        raise ObjectNotFoundError('Column not found.', ObjectName(val))
 
 
     def get_column_or_none(self, val: NameLike) -> ExprObjectABC | None:
@@ -281,10 +283,8 @@ class ViewABC(ABC):
                 
         # If a val is not ExprObjectABC and is ExprABC,
         #   search from the exprs in self selected expression set
-        else:
-            for sel_expr in self._selected_exprs:
-                if isinstance(sel_expr, AliasedExpr) and val is sel_expr.expr:
-                    return sel_expr
+        elif (sel_expr := self._selected_exprs.get_aliased_by_expr(val)) is not None:
+            return sel_expr
 
         raise ObjectNotFoundError(
             'The specified column or Expression is not included in this view.', val)
@@ -332,14 +332,28 @@ class ViewABC(ABC):
                 
         # If a val is not ExprObjectABC and is ExprABC,
         #   search from the exprs in self selected expression set
-        else:
-            for sel_expr in self._selected_exprs:
-                if isinstance(sel_expr, AliasedExpr) and val is sel_expr.expr:
-                    return sel_expr
+        elif (sel_expr := self._selected_exprs.get_aliased_by_expr(val)) is not None:
+            return sel_expr
 
         raise ObjectNotFoundError(
             'The specified column or Expression is not included in this view.', val)
 
+    def _to_columns(self, vals: Iterable[NameLike | ExprABC]) -> Iterator[ExprObjectABC]:
+        """ Get Columns of specific names, or check the Columns are valid (Bulk version of `_to_column`)
+
+            The column sets are looked up once for all the names.
+        """
+        selected_get = self._selected_exprs.get
+        base_get = self._base_column_set.get
+        for val in vals:
+            if type(val) is str or type(val) is bytes or type(val) is ObjectName:
+                key = val.encode() if isinstance(val, str) else val
+                if (col := selected_get(key)) is None and (col := base_get(key)) is None:
+                    raise ObjectNotFoundError('Column not found.', ObjectName(val))
+                yield col
+            else:
+                yield self._to_column(val)
+
     def _to_column_or_none(self, val: NameLike | ExprABC) -> ExprObjectABC | None:
         """ Get a Column of a specific name, or check the Column is valid
 
@@ -384,8 +398,8 @@ class ViewABC(ABC):
             self._base_view,  # TODO: ?
             *(column_likes if column_likes is not None else [self._selected_exprs]),
             where = self._where_expr & where,
-            groups = (*self._groups, *groups),  # TODO: Add overwrite mode
-            orders = (*self._orders, *orders),  # TODO: Add overwrite mode
+            groups = (*self._groups, *groups) if groups else self._groups,  # TODO: Add overwrite mode
+            orders = (*self._orders, *orders) if orders else self._orders,  # TODO: Add overwrite mode
             limit = limit if limit is not None else self._limit_value,
             offset = offset if offset is not None else self._offset_value,
         )
@@ -426,9 +440,7 @@ class ViewABC(ABC):
         Returns:
             ViewABC: New View object with additional columns
         """
-        return self.clone(column_likes=itertools.chain(
-            [self._selected_exprs],
-            self._proc_col_args(*cols, **as_cols)))
+        return self.clone(column_likes=(self._selected_exprs, *self._proc_col_args(*cols, **as_cols)))
 
     def where(self, *exprs: ExprABC, **coleqs: ExprABC) -> ViewABC:
         """ Clone this view with additional WHERE condition(s)
@@ -458,9 +470,11 @@ class ViewABC(ABC):
         Returns:
             ViewABC: New View object with WHERE conditions
         """
+        if not exprs and not coleqs:
+            return self.clone()
         return self.clone(where=OP.AND(
             *exprs,
-            *(self.get_column(c) == v for c, v in coleqs.items()))
+            *(col == v for col, v in zip(self._to_columns(coleqs), coleqs.values())))
         )
 
     def group_by(self, *columns: NameLike | ColumnABC, **cols: bool | None) -> ViewABC:
@@ -488,8 +502,9 @@ class ViewABC(ABC):
         Returns:
             ViewABC: New View object with grouping columns
         """
-        return self.clone(groups=itertools.chain(
-            columns, *(c for c, v in cols.items() if v)))
+        if not cols:
+            return self.clone(groups=columns)
+        return self.clone(groups=(*columns, *(c for c, v in cols.items() if v)))
 
     def order_by(self,
         *columns: NameLike | ExprObjectABC,
@@ -536,8 +551,9 @@ class ViewABC(ABC):
         Returns:
             ViewABC: New View object with grouping columns
         """
-        return self.clone(orders=itertools.chain(
-            columns, ((c, v) for c, v in col_orders.items() if v is not None)))
+        if not col_orders:
+            return self.clone(orders=columns)
+        return self.clone(orders=(*columns, *((c, v) for c, v in col_orders.items() if v is not None)))
 
     def limit(self, limit: ExprABC) -> ViewABC:
         """ Make a View object with LIMIT OFFSET clause """
@@ -628,6 +644,9 @@ class ViewABC(ABC):
         
     def __getitem__(self, val):
 
+        if type(val) is str or type(val) is bytes or type(val) is ObjectName: # Most common case
+            return self.get_column(val)
+
         if isinstance(val, int):
             return self.clone(offset=val, limit=1) # TODO: Implementation
 
@@ -650,7 +669,7 @@ class ViewABC(ABC):
 
         if isinstance(val, tuple):
             if all(isinstance(v, (bytes, str, ObjectName)) for v in val):
-                return (*(self.get_column(v) for v in val),)
+                return (*self._to_columns(val),)
 
             if all(isinstance(v, ExprABC) for v in val):
                 return self.where(*val)
@@ -680,10 +699,11 @@ class ViewABC(ABC):
 
     @property
     def _select_query(self) -> QueryData:
-        if self._select_query_or_none is None:
+        if (qd := self._select_query_or_none) is None:
             self._refresh_select_query()
-        assert self._select_query_or_none is not None
-        return self._select_query_or_none
+            qd = self._select_query_or_none
+            assert qd is not None
+        return qd
     
     @abstractmethod
     def refresh_result(self) -> None:
@@ -730,20 +750,22 @@ class ViewABC(ABC):
         return super().__eq__(value)
 
     def _check_eq(self, view: ViewABC) -> bool:
-        return (self._base_view == view._base_view
+        if view is self:
+            return True
+        # Compare the cheap attributes first (expressions are compared by identity)
+        return (self._where_expr is view._where_expr
+            and self._limit_value  == view._limit_value
+            and self._offset_value == view._offset_value
+            and self._base_view == view._base_view
             and self._selected_exprs == view._selected_exprs
-            and self._where_expr  == view._where_expr
             and self._groups == view._groups
-            and self._orders == view._orders
-            and self._limit_value  == view._limit_value
-            and self._offset_value == view._offset_value)
+            and self._orders == view._orders)
 
     def drop(self, *, if_exists=False):
         """ Run DROP VIEW query """
-        if_exists = if_exists or (not self._exists_on_db)
         return self.db.execute(
             b'DROP', b'VIEW',
-            b'IF NOT EXISTS' if if_exists else None, self)
+            (b'IF', b'EXISTS') if if_exists else None, self)
 
     def create(self, *, if_not_exists=False, drop_if_exists=False) -> None:
         """ Create this View on the database """
@@ -760,14 +782,14 @@ class ViewABC(ABC):
     def _proc_view(self, viewlike: ViewABC | NameLike) -> ViewABC:
         if isinstance(viewlike, ViewABC):
             return viewlike
-        return self._database[viewlike]
+        return self._database.get_table(viewlike)  # Resolved via the database's name cache
 
-    def _proc_col_args(self, *collikes: ColumnArgTypes, **as_exprs: NameLike | ExprABC) -> Iterable[ColumnArgTypes]:
-        return itertools.chain(
-            collikes,
-            (expr.aliased(name) if isinstance(expr, ExprABC) else (expr, name)
-                for name, expr in as_exprs.items())
-        )
+    def _proc_col_args(self, *collikes: ColumnArgTypes, **as_exprs: NameLike | ExprABC) -> tuple[ColumnArgTypes, ...]:
+        if not as_exprs:
+            return collikes
+        return (*collikes, *(
+            expr.aliased(name) if isinstance(expr, ExprABC) else (expr, name)
+            for name, expr in as_exprs.items()))
 
     def __repr__(self) -> str:
         if self._view_name_or_none is not None:
@@ -793,10 +815,11 @@ class BaseViewABC(ViewABC):
 
     @property
     def _select_from_query(self) -> QueryData:
-        if self._select_from_query_or_none is None:
+        if (qd := self._select_from_query_or_none) is None:
             self._refresh_select_from_query()
-        assert self._select_from_query_or_none is not None
-        return self._select_from_query_or_none
+            qd = self._select_from_query_or_none
+            assert qd is not None
+        return qd
 
     @property
     def _selected_exprs(self) -> FrozenOrderedExprObjectSet:
@@ -813,15 +836,15 @@ class BaseViewABC(ViewABC):
 
     @property
     def _orders(self) -> FrozenOrderedExprObjectSet:
-        return FrozenOrderedExprObjectSet()
+        return _EMPTY_EXPR_SET
 
     @property
     def _outer_orders(self) -> FrozenOrderedExprObjectSet:
-        return FrozenOrderedExprObjectSet()
+        return _EMPTY_EXPR_SET
 
     @property
     def _groups(self) -> FrozenOrderedExprObjectSet:
-        return FrozenOrderedExprObjectSet()
+        return _EMPTY_EXPR_SET
 
     @property
     def _limit_value(self) -> ExprLike | None:
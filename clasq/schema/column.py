@@ -29,6 +29,7 @@ class NamedViewColumn(NamedViewColumnABC, Object):
         super().__init__(name)
         self.__named_view = named_view
         self.__sql_type = make_sql_type(sql_type)
+        self.__name_with_view: ObjectName | None = None
 
     @property
     def _named_view(self) -> NamedViewABC:
@@ -41,6 +42,15 @@ class NamedViewColumn(NamedViewColumnABC, Object):
     def _sql_type(self) -> Type[SQLTypeABC]:
         return self.__sql_type
 
+    @property
+    def _name_with_view(self) -> ObjectName:
+        """ Get a column name with its view name
+            (Override from `NamedViewColumnABC`, made once since the names do not change)
+        """
+        if (name := self.__name_with_view) is None:
+            name = self.__name_with_view = super()._name_with_view
+        return name
+
     @property
     def select_column_query(self) -> QueryLike:
         """ Get a query for SELECT column """
@@ -51,7 +61,10 @@ class NamedViewColumn(NamedViewColumnABC, Object):
             % (repr(self.base_view), self.name, repr(self.expr)))
 
 
-class FrozenOrderedNamedViewColumnSet(FrozenOrderedKeySetABC[ObjectName, NamedViewColumnABC]):
+class FrozenOrderedNamedViewColumnSet(FrozenOrderedKeySetABC[ObjectName | bytes, NamedViewColumnABC]):
+    """ Frozen ordered set of named view columns
+        (Keyed by ObjectName, which can be looked up with its raw bytes as well)
+    """
 
     def _key(self, obj: NamedViewColumnABC) -> ObjectName:
         return obj._name_with_view
@@ -105,10 +118,11 @@ class ColumnArgs:
 class TableColumn(TableColumnABC, Object):
     """ Table Column expression """
 
-    def __init__(self, table: Table, args: ColumnArgs):
+    def __init__(self, table: Table, args: ColumnArgs, column_id: int):
         self._table = table
         super().__init__(args.name)
 
+        self.__column_id = column_id
         self.__sql_type = make_sql_type(args.sql_type)
         self.__nullable = args.nullable and not args.primary
         self.__table = table
@@ -117,6 +131,9 @@ class TableColumn(TableColumnABC, Object):
         self.__is_primary = args.primary
         self.__is_auto_increment = args.auto_increment
         self.__reference: ForeignKeyReference | None =  None
+        self.__query: QueryData | None = None
+        self.__create_table_query: QueryData | None = None
+        self.__name_with_view: ObjectName | None = None
 
         if args.ref_column is not None:
             self._reference = ForeignKeyReference(
@@ -158,6 +175,10 @@ class TableColumn(TableColumnABC, Object):
     def table_or_none(self):
         return self.__table
 
+    @property
+    def column_id(self) -> int:
+        return self.__column_id
+
     @property
     def default_value(self):
         return self.__default_value
@@ -180,16 +201,38 @@ class TableColumn(TableColumnABC, Object):
 
     @property
     def query_for_create_table(self) -> QueryData:
-        return QueryData(
-            self.name, b' ',
-            self._sql_type.sql_type_name,
-            (b'NOT', b'NULL') if not self.is_nullable else None,
-            (b'DEFAULT', self.default_value) if self.default_value else None,
-            b'UNIQUE' if self.is_unique else None,
-            (b'PRIMARY', b'KEY') if self.is_primary else None,
-            b'AUTO_INCREMENT' if self.is_auto_increment else None,
-            # self._reference,
-        )
+        """ Get a column definition query for CREATE TABLE
+            (Made on the first call since the column options do not change)
+        """
+        if (query := self.__create_table_query) is None:
+            query = self.__create_table_query = QueryData(
+                self.name, b' ',
+                self._sql_type.sql_type_name,
+                (b'NOT', b'NULL') if not self.is_nullable else None,
+                (b'DEFAULT', self.default_value) if self.default_value else None,
+                b'UNIQUE' if self.is_unique else None,
+                (b'PRIMARY', b'KEY') if self.is_primary else None,
+                b'AUTO_INCREMENT' if self.is_auto_increment else None,
+                # self._reference,
+            )
+        return query
+
+    @property
+    def _name_with_view(self) -> ObjectName:
+        """ Get a column name with its table name
+            (Override from `NamedViewColumnABC`, made once since the names do not change)
+        """
+        if (name := self.__name_with_view) is None:
+            name = self.__name_with_view = super()._name_with_view
+        return name
+
+    def append_to_query_data(self, qd: QueryData) -> None:
+        """ Append this column (with its table name) to the QueryData object
+            (Override from `NamedViewColumnABC`, rendered once since the names do not change)
+        """
+        if (query := self.__query) is None:
+            query = self.__query = QueryData(self.__table, b'.', self.name)
+        qd.append_query_data(query)
 
     def __repr__(self):
         return 'TC(%s->%s)' % (repr(self.base_view), self.name)
@@ -2,7 +2,7 @@
     Database class definition
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 
 from ..syntax.abc.object import NameLike, ObjectName
@@ -19,6 +19,11 @@ if TYPE_CHECKING:
 class Database(DatabaseABC, Object):
     """ Database Expr """
 
+    __slots__ = (
+        '__table_dict', '__tables_cache', '__name_cache', '__con', '__charset', '__collate',
+        '__schema_cache_path', '__schema_cache_ttl', '__create_database_queries', '__drop_database_queries',
+    )
+
     def __init__(self,
         name: NameLike,
         *table_args: TableArgs,
@@ -26,13 +31,22 @@ class Database(DatabaseABC, Object):
         charset: NameLike | None = None,
         collate: NameLike | None = None,
         fetch_from_db: bool | None = None,
+        schema_cache_path: str | None = None,
+        schema_cache_ttl: float | None = None,
         # **options
     ):
         super().__init__(name)
+        self.__schema_cache_path = schema_cache_path
+        self.__schema_cache_ttl = schema_cache_ttl
         self.__table_dict: dict[ObjectName, TableABC] = {}
+        self.__tables_cache: dict[str, object] = {}
+        self.__name_cache: dict[str | bytes, TableABC] = {}
         self.__con: ConnectionABC | None = None
-        self.__charset = ObjectName(charset) if charset is not None else None
-        self.__collate = ObjectName(collate) if collate is not None else None
+        # Charset and collation names are made on the first use
+        self.__charset: NameLike | None = charset
+        self.__collate: NameLike | None = collate
+        self.__create_database_queries: tuple[tuple, tuple] | None = None
+        self.__drop_database_queries: tuple[tuple, tuple] | None = None
         # self._options = options
 
         self.connect(con)
@@ -72,17 +86,59 @@ class Database(DatabaseABC, Object):
                     raise RuntimeError('Connection is already set.')
 
     @property
-    def _charset(self):
-        return self.__charset
+    def _charset(self) -> ObjectName | None:
+        if self.__charset is not None and type(self.__charset) is not ObjectName:
+            self.__charset = ObjectName(self.__charset)
+        return cast(ObjectName | None, self.__charset)
 
     @property
-    def _collate(self):
-        return self.__collate
+    def _collate(self) -> ObjectName | None:
+        if self.__collate is not None and type(self.__collate) is not ObjectName:
+            self.__collate = ObjectName(self.__collate)
+        return cast(ObjectName | None, self.__collate)
 
     @property
     def _table_dict(self) -> dict[ObjectName, TableABC]:
         return self.__table_dict
 
+    @property
+    def _tables_cache(self) -> dict[str, object]:
+        """ Override for `DatabaseABC` """
+        return self.__tables_cache
+
+    @property
+    def _name_cache(self) -> dict[str | bytes, TableABC]:
+        """ Override for `DatabaseABC` """
+        return self.__name_cache
+
+    @property
+    def _schema_cache_path(self) -> str | None:
+        """ Override for `DatabaseABC` """
+        return self.__schema_cache_path
+
+    @property
+    def _schema_cache_ttl(self) -> float | None:
+        """ Override for `DatabaseABC` """
+        return self.__schema_cache_ttl
+
+    def _create_database_query(self, *, if_not_exists=False) -> tuple:
+        """ Override for `DatabaseABC` (Use the query built on the first call) """
+        if (queries := self.__create_database_queries) is None:
+            queries = self.__create_database_queries = (
+                super()._create_database_query(if_not_exists=False),
+                super()._create_database_query(if_not_exists=True),
+            )
+        return queries[bool(if_not_exists)]
+
+    def _drop_database_query(self, *, if_exists=False) -> tuple:
+        """ Override for `DatabaseABC` (Use the query built on the first call) """
+        if (queries := self.__drop_database_queries) is None:
+            queries = self.__drop_database_queries = (
+                super()._drop_database_query(if_exists=False),
+                super()._drop_database_query(if_exists=True),
+            )
+        return queries[bool(if_exists)]
+
     def _new_table(self, table_arg: TableArgs) -> TableABC:
         """ Make a new table """
         return Table(self, table_arg)
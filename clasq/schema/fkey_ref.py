@@ -11,6 +11,10 @@ from .column import TableColumn
 class ForeignKeyReference(Object):
     """ Foreign Key Reference """
 
+    __slots__ = (
+        '_orig_table', '_ref_table', '_orig_columns', '_ref_columns', '_on_delete', '_on_update', '_query',
+    )
+
     def __init__(self,
         orig_column: TableColumn | tuple[TableColumn, ...],
         ref_column : TableColumn | tuple[TableColumn, ...],
@@ -21,20 +25,24 @@ class ForeignKeyReference(Object):
     ):
         super().__init__(name or b'')
         
-        _orig_columns = orig_column if isinstance(orig_column, (tuple, list)) else [orig_column]
-        _ref_columns  = ref_column  if isinstance(ref_column , (tuple, list)) else [ref_column]
-        assert len(_orig_columns) and _orig_columns[0].table is not None
-        assert len(_ref_columns ) and _ref_columns [0].table is not None
-
-        self._orig_table = _orig_columns[0].table
-        self._ref_table = _ref_columns[0].table
-        assert all(self._orig_table == c.table for c in _orig_columns)
-        assert all(self._ref_table  == c.table for c in _ref_columns)
-
-        self._orig_columns = orig_column if isinstance(orig_column, (tuple, list)) else [orig_column]
-        self._ref_columns  = ref_column  if isinstance(ref_column , (tuple, list)) else [ref_column]
+        self._orig_columns = tuple(orig_column) if isinstance(orig_column, (tuple, list)) else (orig_column,)
+        self._ref_columns  = tuple(ref_column)  if isinstance(ref_column , (tuple, list)) else (ref_column,)
+        assert len(self._orig_columns) and self._orig_columns[0].table is not None
+        assert len(self._ref_columns ) and self._ref_columns [0].table is not None
+
+        self._orig_table = self._orig_columns[0].table
+        self._ref_table = self._ref_columns[0].table
+        assert all(self._orig_table is c.table for c in self._orig_columns)
+        assert all(self._ref_table  is c.table for c in self._ref_columns)
+
         self._on_delete = on_delete
         self._on_update = on_update
+        self._query = QueryData(
+            b'FOREIGN', b'KEY', self.name, b'(', [c.name for c in self._orig_columns], b')',
+            b'REFERENCES', self._ref_table, b'(', [c.name for c in self._ref_columns], b')',
+            (b'ON', b'DELETE', self._on_delete) if self._on_delete else None,
+            (b'ON', b'UPDATE', self._on_update) if self._on_update else None,
+        )
 
     @property
     def on_delete(self):
@@ -46,9 +54,4 @@ class ForeignKeyReference(Object):
 
     def append_to_query_data(self, qd: QueryData) -> None:
         """ Append this to query data"""
-        qd.append(
-            b'FOREIGN', b'KEY', self.name, b'(', [super(Object, c) for c in self._orig_columns], b')',
-            b'REFERENCES', self._ref_table, b'(', [super(Object, c) for c in self._ref_columns], b')',
-            (b'ON', b'DELETE', self._on_delete) if self._on_delete else None,
-            (b'ON', b'UPDATE', self._on_update) if self._on_update else None,
-        )
+        qd.append_query_data(self._query)
@@ -2,6 +2,7 @@
     Definitions of built-in data types in SQL
 """
 from __future__ import annotations
+import functools
 import typing
 import datetime
 import decimal
@@ -405,6 +406,17 @@ class PrimaryKey(typing.Generic[T]):
 # SQLType = typing.Union[TypedTableColumnABC, typing.Type]
 
 def make_sql_type(typelike: typing.Type) -> typing.Type[sqtabc.SQLTypeABC]:
+    """ Get a SQL type class from a type-like object
+        (Results are cached since columns of a schema share a few types;
+         the cache is bounded because type-like objects can be created at runtime)
+    """
+    return _make_sql_type_cached(typing.cast(typing.Hashable, typelike))
+
+@functools.lru_cache(maxsize=256)
+def _make_sql_type_cached(typelike: typing.Hashable) -> typing.Type[sqtabc.SQLTypeABC]:
+    return _make_sql_type(typing.cast(typing.Type, typelike))
+
+def _make_sql_type(typelike: typing.Type) -> typing.Type[sqtabc.SQLTypeABC]:
 
     _origin = typing.get_origin(typelike) or typelike
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from ..syntax.abc.query import iter_objects
 from ..syntax.abc.object import ObjectABC, ObjectName
+from ..syntax.query_data import QueryData
 from .abc.table import TableArgs, TableABC
 from .column import FrozenOrderedNamedViewColumnSet, TableColumn
 from .view import NamedView, ViewFinal
@@ -14,28 +15,45 @@ from .abc.database import DatabaseABC
 class Table(TableABC, NamedView, ViewFinal):
     """ Table Expr """
 
+    __slots__ = (
+        '__database', '__name', '__name_query', '__table_columns', '__refs', '__query_cache', '__column_name_cache',
+        '__data_columns_cache', '__primary_keys', '__unique_columns', '__exists_on_db',
+    )
+
     def __init__(self, database: DatabaseABC, args: TableArgs):
         self.__database = database
         self.__name = ObjectName(args.name)
+        self.__name_query = QueryData(self.__name)
 
         # if self.__name in database:
         #     raise ObjectNameAlreadyExistsError('Table name already exists.', self.__name)
 
-        super().__init__(FrozenOrderedNamedViewColumnSet(
-            TableColumn(self, colargs) for colargs in args.column_args))
+        table_columns = tuple(TableColumn(self, colargs, i) for i, colargs in enumerate(args.column_args))
+        super().__init__(FrozenOrderedNamedViewColumnSet(table_columns))
         
+        self.__table_columns = table_columns
         self.__refs = args.refs
+        self.__query_cache: dict[tuple, QueryData] = {}
+        self.__column_name_cache: dict[str | bytes, TableColumn] = {}
+        for col in table_columns:
+            raw_name = col.get_raw_name()
+            self.__column_name_cache[raw_name] = self.__column_name_cache[raw_name.decode()] = col
+        self.__data_columns_cache: dict[tuple, tuple[TableColumn, ...]] = {}
         self.__primary_keys = [self.get_table_column(c) for c in (args.primary_key or ())]
         self.__unique_columns = [self.get_table_column(c) for c in (args.unique or ())]
-
-    def _refresh_select_from_query(self) -> None:
-        pass  # Do nothing
+        self.__exists_on_db: bool | None = None
 
     def get_name(self) -> ObjectName:
         """ Get a view name 
             (Override from `ObjectABC`) """
         return self.__name
 
+    def append_to_query_data(self, qd: QueryData) -> None:
+        """ Append a query of this table
+            (Override from `TableABC`, rendered once since the name does not change)
+        """
+        qd.append_query_data(self.__name_query)
+
     @property
     def _view_name_or_none(self) -> ObjectName | None:
         """ Get a view name 
@@ -49,6 +67,20 @@ class Table(TableABC, NamedView, ViewFinal):
         """
         return self.__database
 
+    @property
+    def _database(self) -> DatabaseABC:
+        """ Get a parent Database object
+            (Override from `ViewABC`, a table always has a database)
+        """
+        return self.__database
+
+    @property
+    def db(self) -> DatabaseABC:
+        """ Get a parent Database object
+            (Override from `ViewABC`, a table always has a database)
+        """
+        return self.__database
+
     @property
     def _primary_keys(self):
         return self.__primary_keys
@@ -57,11 +89,44 @@ class Table(TableABC, NamedView, ViewFinal):
     def _unique_columns(self):
         return self.__unique_columns
 
+    @property
+    def _query_cache(self) -> dict[tuple, QueryData]:
+        return self.__query_cache
+
+    @property
+    def _table_columns(self) -> tuple[TableColumn, ...]:
+        return self.__table_columns
+
+    @property
+    def _column_name_cache(self) -> dict[str | bytes, TableColumn]:
+        return self.__column_name_cache
+
+    @property
+    def _data_columns_cache(self) -> dict[tuple, tuple[TableColumn, ...]]:
+        return self.__data_columns_cache
+
+    @property
+    def _exists_on_db(self) -> bool | None:
+        return self.__exists_on_db
+
+    @_exists_on_db.setter
+    def _exists_on_db(self, exists: bool | None):
+        self.__exists_on_db = exists
+
 
 def iter_tables(*exprs: ObjectABC | None):
+    """ Iterate the tables used in the expressions
+        (Each table is yielded only once)
+    """
+    seen_ids: set[int] = set()
     for e in iter_objects(*exprs):
-        if isinstance(e, TableColumn):
-            if e.table_or_none is not None:
-                yield e.table
-        elif isinstance(e, Table):
-            yield e
+        e_type = type(e)
+        if e_type is TableColumn or isinstance(e, TableColumn):
+            table = e.table_or_none
+        elif e_type is Table or isinstance(e, Table):
+            table = e
+        else:
+            continue
+        if table is not None and id(table) not in seen_ids:
+            seen_ids.add(id(table))
+            yield table
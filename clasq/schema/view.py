@@ -25,6 +25,8 @@ class ViewWithColumns(ViewWithColumnsABC):
         assert isinstance(column_set, FrozenOrderedNamedViewColumnSet)
         assert all(isinstance(col, NamedViewColumnABC) for col in column_set)
         self._named_view_columns = column_set
+        # Made once since the base columns do not change
+        self.__selected_exprs = FrozenOrderedExprObjectSet(column_set)
 
     @property
     def _base_column_set(self) -> FrozenOrderedNamedViewColumnSet:
@@ -36,6 +38,13 @@ class ViewWithColumns(ViewWithColumnsABC):
         """
         return self._named_view_columns
 
+    @property
+    def _selected_exprs(self) -> FrozenOrderedExprObjectSet:
+        """ Set of selected column (or expression) in this view
+            (Override from `BaseViewABC`, made once since the base columns do not change)
+        """
+        return self.__selected_exprs
+
 
 class NamedView(NamedViewABC, ViewWithColumns):
     """ Named View class """
@@ -50,19 +59,25 @@ class ViewFinal(ViewABC):
 
     def _generate_select_query(self) -> QueryData:
         """ Generate QueryData for SELECT query """
-        assert self._selected_exprs
+        selected_exprs = self._selected_exprs
+        assert selected_exprs
         # print('self.base_view.select_from_query=', self.base_view.select_from_query)
         # assert self.base_view.select_from_query
-        self._base_view._refresh_select_from_query()
+        base_view = self._base_view
+        where_expr = self._where_expr
+        groups = self._groups
+        orders = self._orders
+        limit_value = self._limit_value
+        offset_value = self._offset_value
         return QueryData(
             b'SELECT',
-            [c.select_column_query for c in self._selected_exprs],
-            b'FROM', self._base_view._select_from_query,
-            (b'WHERE', self._where_expr) if self._where_expr is not NoneExpr else None,
-            (b'GROUP', b'BY', [*self._groups]) if self._groups else None,
-            (b'ORDER', b'BY', [c.ordered_query for c in self._orders]) if self._orders else None,
-            (b'LIMIT', self._limit_value) if self._limit_value else None,
-            (b'OFFSET', self._offset_value) if self._offset_value else None,
+            [c.select_column_query for c in selected_exprs],
+            b'FROM', base_view._select_from_query,
+            (b'WHERE', where_expr) if where_expr is not NoneExpr else None,
+            (b'GROUP', b'BY', [*groups]) if groups else None,
+            (b'ORDER', b'BY', [c.ordered_query for c in orders]) if orders else None,
+            (b'LIMIT', limit_value) if limit_value else None,
+            (b'OFFSET', offset_value) if offset_value else None,
         )
 
     def _refresh_select_query(self) -> None:
@@ -120,10 +135,14 @@ class JoinedView(ViewWithColumns, ViewWithTargetABC, ViewFinal):
         self.__view_to_join = join_view
         self.__expr_for_join = expr
 
-        if duplicate_columns := dest_view._base_column_set & join_view._base_column_set:
-            raise ObjectError('Duplicate column names:', duplicate_columns)
+        # Duplicate columns are merged by the union, so find them only if the size does not match
+        dest_columns = dest_view._base_column_set
+        join_columns = join_view._base_column_set
+        base_columns = dest_columns | join_columns
+        if len(base_columns) != len(dest_columns) + len(join_columns):
+            raise ObjectError('Duplicate column names:', dest_columns & join_columns)
 
-        super().__init__(dest_view._base_column_set | join_view._base_column_set)
+        super().__init__(base_columns)
 
         self.__selected_exprs = self._merge_selected_exprs(
             dest_view._selected_exprs, join_view._selected_exprs,
@@ -138,14 +157,13 @@ class JoinedView(ViewWithColumns, ViewWithTargetABC, ViewFinal):
         alias_format: ObjectName,
     ) -> FrozenOrderedExprObjectSet:
         _selected_exprs = OrderedExprObjectSet(exprs1)
+        raw_alias_format = alias_format.raw_name
         for expr in exprs2:
-            if expr in _selected_exprs:
-                continue
-            if (expr_name := expr.get_name()) in _selected_exprs:
-                new_name = alias_format % expr_name
-                _selected_exprs.add(AliasedExpr(expr, new_name))
-            else:
+            expr_name = expr.get_name()
+            if (same_name_expr := _selected_exprs.get(expr_name)) is None:
                 _selected_exprs.add(expr)
+            elif same_name_expr is not expr:
+                _selected_exprs.add(AliasedExpr(expr, raw_alias_format % expr_name.raw_name))
         return FrozenOrderedExprObjectSet(_selected_exprs)
 
     
@@ -184,15 +202,14 @@ class JoinedView(ViewWithColumns, ViewWithTargetABC, ViewFinal):
 
     def _refresh_select_from_query(self) -> None:
         """ Refresh QueryData for SELECT FROM """
-        on_expr = (self._expr_for_join & self._view_to_join._where_expr)
+        view_to_join = self._view_to_join
+        on_expr = (self._expr_for_join & view_to_join._where_expr)
         # print('on_expr = ', on_expr)
-        self._target_view._base_view._refresh_select_from_query()
         target_from_query = self._target_view._base_view._select_from_query
-        assert target_from_query is not None
         self.__select_from_query = QueryData(
             b'(', target_from_query, (
-                self._join_type, b'JOIN',
-                self._view_to_join._base_view._select_from_query,
+                self.__join_type, b'JOIN',
+                view_to_join._base_view._select_from_query,
                 (b'ON', on_expr) if on_expr is not NoneExpr else None
             ), b')'
         )
@@ -210,6 +227,7 @@ class SubqueryView(NamedView):
     """ Subquery View """
     def __init__(self, target_view: ViewABC) -> None:
         self.__target_view = target_view
+        self.__select_from_query: QueryData | None = None
         super().__init__(FrozenOrderedNamedViewColumnSet(
             NamedViewColumn(self, col.get_name(), AnySQLType) # TODO: Fix type
             for col in target_view._selected_exprs))
@@ -222,13 +240,15 @@ class SubqueryView(NamedView):
         qd += self._view_name
 
     def _refresh_select_from_query(self) -> None:
-        return self._target_view._refresh_select_query()
+        """ Refresh QueryData for SELECT FROM (using the cached SELECT query of the target view) """
+        target_view = self._target_view
+        self.__select_from_query = QueryData(
+            b'(', target_view._select_query, b')',
+            b'AS', target_view)
 
     @property
     def _select_from_query_or_none(self) -> QueryData | None:
-        return QueryData(
-            b'(', self._target_view._select_query, b')',
-            b'AS', self._target_view)
+        return self.__select_from_query
 
     def __repr__(self) -> str:
         return 'SqV(%s)' % self._target_view
@@ -283,12 +303,12 @@ class CustomView(CustomViewABC, ViewFinal):
         assert all(isinstance(c, (bytes, str, ObjectName, ExprObjectABC, tuple)) for c in orders)
         assert outer_orders is None or all(isinstance(c, OrderedExprObject) for c in outer_orders)
 
-        self.__selected_exprs = self._process_select_column_args(*column_likes)
-        if not self._selected_exprs:
+        self.__selected_exprs = selected_exprs = self._process_select_column_args(*column_likes)
+        if not selected_exprs:
             raise ObjectArgValueError('Columns cannot be empty.')
             
         self.__where_expr = where
-        self.__groups = FrozenOrderedExprObjectSet(self._to_column(c) for c in groups)
+        self.__groups = FrozenOrderedExprObjectSet(self._to_columns(groups))
         self.__orders = (
             FrozenOrderedExprObjectSet(self._process_order_args(*orders)) | base_view._outer_orders)
 
@@ -300,7 +320,12 @@ class CustomView(CustomViewABC, ViewFinal):
 
     def _process_select_column_args(self, *column_likes: ColumnArgTypes) -> FrozenOrderedExprObjectSet:
 
+        # A frozen set of selected expressions (e.g. given by `clone`) is shared as it is
+        if len(column_likes) == 1 and type(column_likes[0]) is FrozenOrderedExprObjectSet:
+            return column_likes[0]
+
         _selected_exprs = OrderedExprObjectSet()
+        base_view = self._base_view
         
         for column_like in column_likes:
 
@@ -320,14 +345,14 @@ class CustomView(CustomViewABC, ViewFinal):
             #   Make a AliasedExpr object
             elif (isinstance(column_like, tuple) and len(column_like) == 2):
                 expr, name = column_like
-                if (column := self._base_view._to_column_or_none(expr)) is None:
+                if (column := base_view._to_column_or_none(expr)) is None:
                     raise ObjectNotFoundError('Column not found.', expr)
                 new_expr = AliasedExpr(column, name)
             
             # ColumnABC or NameLike:
             #   Get a column/expr object from the base view
             elif isinstance(column_like, (bytes, str, ObjectName)):
-                if (column := self._base_view.get_column_or_none(column_like)) is None:
+                if (column := base_view.get_column_or_none(column_like)) is None:
                     raise ObjectNotFoundError('Column not found.', column_like)
                 new_expr = column
 
@@ -344,11 +369,12 @@ class CustomView(CustomViewABC, ViewFinal):
 
 
     def _process_order_args(self, *column_orders: OrderedColumnArgTypes) -> Iterator[OrderedExprObject]:
+        base_view = self._base_view
         
         for col_order in column_orders:
             if isinstance(col_order, tuple) and len(col_order) == 2:
                 expr, otype = col_order
-                yield self._base_view._to_column(expr).ordered(otype)
+                yield base_view._to_column(expr).ordered(otype)
             
             elif isinstance(col_order, (bytes, str, ObjectName)):
                 _name = ObjectName(col_order)
@@ -357,9 +383,9 @@ class CustomView(CustomViewABC, ViewFinal):
                     OrderType.DESC if _name.raw_name[0:1] == b'-' else None)
                 if _otype is not None:
                     _name_entity = _name.raw_name[1:]
-                    yield self._base_view.get_column(_name_entity).ordered(_otype)
+                    yield base_view.get_column(_name_entity).ordered(_otype)
                 else:
-                    yield self._base_view.get_column(_name).ordered(OrderType.ASC)
+                    yield base_view.get_column(_name).ordered(OrderType.ASC)
             elif isinstance(col_order, ExprObjectABC):
                 if isinstance(col_order, OrderedExprObject):
                     yield col_order
@@ -37,8 +37,10 @@ class ObjectName(QueryABC):
         return self.raw_name.decode()
 
     def __eq__(self, obj: object) -> bool:
+        if obj is self:
+            return True
         if isinstance(obj, ObjectName):
-            return self.raw_name == obj.raw_name
+            return self._raw_name == obj._raw_name
         if isinstance(obj, str):
             return str(self) == obj
         if isinstance(obj, bytes):
@@ -71,7 +73,7 @@ class ObjectName(QueryABC):
 
 
     def __hash__(self) -> int:
-        return hash(self.raw_name)
+        return hash(self._raw_name)
 
     def __repr__(self) -> str:
         return 'ObjName(%s)' % str(self)
@@ -3,7 +3,7 @@
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, Iterator, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Iterator, TypeVar
 
 from ..utils.keyset import FrozenKeySetABC, FrozenOrderedKeySetABC, KeySetABC, OrderedKeySetABC
 from .values import NULL, ValueType, is_value_type
@@ -746,12 +746,26 @@ class ExprObjectSet(KeySetABC[NameLike, ExprObjectABC]):
 class FrozenExprObjectSet(FrozenKeySetABC[NameLike, ExprObjectABC]):
     """ Frozen set of ExprObjectABC objects """
 
+    def __init__(self, objs: Iterable[ExprObjectABC] = ()) -> None:
+        """ Init """
+        super().__init__(objs)
+        self.__aliased_by_expr_id: dict[int, AliasedExpr] | None = None
+
     def _key(self, obj: ExprObjectABC) -> ObjectName:
         return obj.get_name()
 
     def _key_or_none(self, obj) -> ObjectName | None:
         return obj.get_name() if isinstance(obj, ExprObjectABC) else None
 
+    def get_aliased_by_expr(self, expr: ExprABC) -> AliasedExpr | None:
+        """ Get the (first) aliased expression object which has a given expression """
+        if (aliased_by_expr_id := self.__aliased_by_expr_id) is None:
+            aliased_by_expr_id = self.__aliased_by_expr_id = {}
+            for obj in self:
+                if isinstance(obj, AliasedExpr):
+                    aliased_by_expr_id.setdefault(id(obj.expr), obj)
+        return aliased_by_expr_id.get(id(expr))
+
 
 class OrderedExprObjectSet(ExprObjectSet, OrderedKeySetABC[NameLike, ExprObjectABC]):
     """ Ordered set of ExprObjectABC objects """
@@ -3,7 +3,7 @@
 """
 from __future__ import annotations
 import re
-from typing import Collection, Iterable, Iterator, cast
+from typing import Collection, Iterable, Iterator, Sequence, cast
 
 from .abc.query import QueryABC
 from .values import NullType, ValueType, is_value_type
@@ -23,7 +23,7 @@ class QueryData(QueryABC):
     def __init__(self,
         *vals: QueryLike | None,
         stmt: bytes | None = None,
-        # args: Optional[Collection[Arg]] = None,
+        args: Collection[Arg] | None = None,
         prms: Collection[ValueType | Arg] = None,
     ):
         """ Create a QueryData instance
@@ -35,9 +35,10 @@ class QueryData(QueryABC):
             prms (Optional[list[ValueOrArg]], optional): Initial list of parameter values. Defaults to None.
         """
         self._stmt = stmt if stmt is not None else b''
-        # self._argdict = {arg.name: arg for arg in args} if args is not None else {} 
-        self._argdict: dict[ArgName, Arg] = {} 
+        self._argdict: dict[ArgName, Arg] = {arg.name: arg for arg in args} if args is not None else {}
         self._prms = [*prms] if prms else []
+        self._positional_plan: tuple[tuple[tuple[int, ValueOrArg], ...], int] | None = None
+        self._pure_prms: tuple[SQLValue, ...] | None = None
         if vals:
             self.append(*vals)
 
@@ -60,8 +61,10 @@ class QueryData(QueryABC):
     
     @property
     def prms(self) -> tuple[SQLValue, ...]:
-        """ Get a tuple of current parameters """
-        return self._calc_pure_params()
+        """ Get a tuple of current parameters (calculated once until the parameters are changed) """
+        if (prms := self._pure_prms) is None:
+            prms = self._pure_prms = self._calc_pure_params()
+        return prms
 
     def call(self, *argvals: ValueType, **kwargvals: ValueType) -> QueryData:
         """ Create a new QueryData instance with query argument values
@@ -78,6 +81,39 @@ class QueryData(QueryABC):
         """
         return self._call(argvals, kwargvals)
 
+    def call_positional(self, argvals: Sequence[ValueType]) -> QueryData:
+        """ Create a new QueryData instance with a sequence of positional query argument values
+            (Positions of the arguments are resolved only once for this QueryData)
+
+        Args:
+            argvals (Sequence[ValueType]): Positional query argument values (None is NULL)
+
+        Raises:
+            QueryArgumentError: The number of argument values does not match.
+            QueryTypeError: Invalid type of argument value.
+
+        Returns:
+            QueryData: New QueryData instance with query argument values
+        """
+        if (plan_and_n_args := self._positional_plan) is None:
+            plan: list[tuple[int, ValueOrArg]] = []  # (Index of argument value (-1 if constant), constant value)
+            n_args = 0
+            for prm in self._prms:
+                if isinstance(prm, Arg) and isinstance(prm.name, int):
+                    plan.append((prm.name, prm))
+                    n_args = max(n_args, prm.name + 1)
+                else:
+                    plan.append((-1, prm))
+            plan_and_n_args = self._positional_plan = (tuple(plan), n_args)
+
+        plan_tuple, n_args = plan_and_n_args
+        if len(argvals) != n_args:
+            raise errors.QueryArgumentError('%d positional argument value(s) are required, but %d given.' % (n_args, len(argvals)))
+        for argval in argvals:
+            if not (argval is None or is_value_type(argval)):
+                raise errors.QueryTypeError('Invalid parameter value type %s (%s)' % (type(argval), repr(argval)))
+        return QueryData(stmt=self._stmt, prms=[val if i < 0 else argvals[i] for i, val in plan_tuple])
+
     def call_ignore_unused(self, *argvals: ValueType, **kwargvals: ValueType) -> QueryData:
         """ Create a new QueryData instance with query argument values
             (Ignore unused arguments)
@@ -88,6 +124,42 @@ class QueryData(QueryABC):
         for argvals in iter_argvals:
             yield self.calc_prms(argvals, ignore_unused=ignore_unused)
 
+    def calc_prms_many_rows(self, columns: Sequence[ArgName], rows: Iterable[Sequence[ValueType]], *, ignore_unused=False) -> Iterator[tuple[SQLValue, ...]]:
+        """ Calculate parameters for each row values of the columns
+            (Positions of the arguments in a row are resolved only once for all rows)
+
+        Args:
+            columns (Sequence[ArgName]): Argument names of the row values
+            rows (Iterable[Sequence[ValueType]]): Row values
+        """
+        col_to_i = {c: i for i, c in enumerate(columns)}
+        unused_argnames: set[ArgName] = set(col_to_i)
+        unset_args: list[Arg] = []
+        plan: list[tuple[int, SQLValue]] = []  # (Index of row value (-1 if constant), constant value)
+
+        for prm in self._prms:
+            if isinstance(prm, Arg) and prm.name in col_to_i:
+                plan.append((col_to_i[prm.name], None))
+                unused_argnames.discard(prm.name)
+                continue
+
+            prmval = prm.default if isinstance(prm, Arg) and prm.has_default else prm
+            if isinstance(prmval, Arg):
+                unset_args.append(prmval)
+            else:
+                plan.append((-1, None if isinstance(prmval, NullType) else prmval))
+
+        if unset_args:
+            raise errors.QueryArgumentError('Argument value(s) are not set: %s' % ', '.join(str(arg.name) for arg in unset_args))
+        if not ignore_unused and unused_argnames:
+            raise errors.QueryArgumentError('Unused arguments exist: %s' % ', '.join(str(name) for name in unused_argnames))
+
+        for row in rows:
+            yield tuple([
+                val if i < 0 else (None if isinstance(v := row[i], NullType) else v)
+                for i, val in plan
+            ])
+
     def calc_prms(self, argvals: Collection[ValueType] | dict[ArgName, ValueType], *, ignore_unused=False) -> tuple[SQLValue, ...]:
         argvaldict = argvals if isinstance(argvals, dict) else dict(enumerate(argvals))
         return self._calc_pure_params(argvaldict, ignore_unused=ignore_unused)
@@ -123,6 +195,8 @@ class QueryData(QueryABC):
                 if not (is_value_type(prm) or isinstance(prm, Arg)):
                     raise errors.QueryTypeError('Invalid parameter value type %s (%s)' % (type(prm), repr(prm)))
                 self._prms.append(prm)
+            self._positional_plan = None
+            self._pure_prms = None
         return self
 
     def append_to_query_data(self, qd: QueryData) -> None:
@@ -203,8 +277,11 @@ class QueryData(QueryABC):
         Returns:
             QueryData: Self object
         """
-        if not (isinstance(keyword, bytes) and self.RE_KEYWORD.fullmatch(keyword)):
-            raise errors.QueryValueError('Keyword has invalid characters.', keyword)
+        if type(keyword) is not bytes or keyword not in _VALID_KEYWORDS:
+            if not (isinstance(keyword, bytes) and self.RE_KEYWORD.fullmatch(keyword)):
+                raise errors.QueryValueError('Keyword has invalid characters.', keyword)
+            if len(_VALID_KEYWORDS) < _VALID_KEYWORDS_MAX:
+                _VALID_KEYWORDS.add(keyword)
         return self._append(keyword)
 
     def append_query_data(self, qd: QueryData) -> QueryData:
@@ -216,6 +293,8 @@ class QueryData(QueryABC):
         Returns:
             QueryData: Self object
         """
+        for arg in qd._argdict.values():
+            self._add_arg(arg)
         return self._append(qd._stmt, qd._prms)
 
     def append_value(self, val: ValueOrArg) -> QueryData:
@@ -231,13 +310,22 @@ class QueryData(QueryABC):
             QueryData: Self object
         """
         if isinstance(val, Arg):
-            if val.name in self._argdict:
-                if not self._argdict[val.name].is_same_arg(val):
-                    raise errors.QueryArgumentError('Cannot specify different arguments with same name.', val.name)
-            else:
-                self._argdict[val.name] = val
+            self._add_arg(val)
         return self._append(self.PLACEHOLDER, [val])
 
+    def _add_arg(self, arg: Arg) -> None:
+        """ Add a query argument
+            (Internal private method)
+
+        Raises:
+            QueryArgumentError: Different arguments with same name are specified.
+        """
+        if arg.name in self._argdict:
+            if not self._argdict[arg.name].is_same_arg(arg):
+                raise errors.QueryArgumentError('Cannot specify different arguments with same name.', arg.name)
+        else:
+            self._argdict[arg.name] = arg
+
     def append_values(self, *vals: ValueOrArg) -> QueryData:
         """ Append multiple args as values
 
@@ -328,7 +416,7 @@ class QueryData(QueryABC):
 
             if argvaldict is not None and isinstance(prm, Arg) and prm.name in argvaldict:
                 prmval: ValueType | Arg = argvaldict[prm.name]
-                unused_argnames.remove(prm.name)
+                unused_argnames.discard(prm.name)
             else:
                 prmval = prm
 
@@ -351,10 +439,15 @@ class QueryData(QueryABC):
 
         for prm in self._prms:
 
-            if argvaldict is not None and isinstance(prm, Arg) and prm.name in argvaldict:
+            # Values are the most common parameters
+            if not isinstance(prm, Arg):
+                new_prms.append(None if isinstance(prm, NullType) else prm)
+                continue
+
+            if argvaldict is not None and prm.name in argvaldict:
                 prmval: ValueType | Arg = argvaldict[prm.name]
-                unused_argnames.remove(prm.name)
-            elif isinstance(prm, Arg) and prm.has_default:
+                unused_argnames.discard(prm.name)
+            elif prm.has_default:
                 prmval = prm.default
             else:
                 prmval = prm
@@ -378,6 +471,11 @@ QueryLike = ValueOrArg | ExprABC | QueryABC | tuple | Iterable
 QueryArgVals = Collection[ValueType] | dict[ArgName, ValueType]
 
 
+# Keywords which are already checked by `RE_KEYWORD`
+# (Keywords are mostly constant literals, so the checks are done once for each)
+_VALID_KEYWORDS: set[bytes] = set()
+_VALID_KEYWORDS_MAX = 4096
+
 _R_NOSP_SYMS = {b' ', b')', b',', b'.'}
 _L_NOSP_SYMS = {b' ', b'(', b'.'}
 _SPACE = b' '
@@ -20,7 +20,8 @@ class NullType(QueryABC):
 NULL = NullType()
 
 ValueType = sql_values.SQLNotNullValue | NullType
+_VALUE_TYPES = get_args(ValueType) # Unwrapped once for `is_value_type`
 
 
 def is_value_type(value) -> bool:
-    return isinstance(value, get_args(ValueType))
+    return isinstance(value, _VALUE_TYPES)
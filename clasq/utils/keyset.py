@@ -62,7 +62,9 @@ class _FrozenKeySetABC(FrozenSetABC[T], Generic[K, T]):
         return type(self)(self._to_objs(self._key_set.__and__(self._to_key_fset(objs))))
 
     def __or__(self, objs: SetLike[T]):
-        return type(self)(itertools.chain(self, objs - self))
+        key_to_obj = self._key_to_obj
+        return type(self)(itertools.chain(
+            self, (obj for obj in objs if self._key(obj) not in key_to_obj)))
 
     def __sub__(self, objs: SetLike[T]):
         return type(self)(self._to_objs(self._key_set.__sub__(self._to_key_fset(objs))))
@@ -108,7 +110,7 @@ class FrozenKeySetABC(_FrozenKeySetABC[K, T], Generic[K, T]):
     def __init__(self, objs: Iterable[T] = ()) -> None:
         """ Init """
         self.__key_to_obj = {self._key(obj): obj for obj in objs}
-        self.__key_fset = self._make_fset(self._key_to_obj.keys())
+        self.__key_fset = self._make_fset(self.__key_to_obj)
 
     @property
     def _key_to_obj(self) -> dict[K, T]:
@@ -124,7 +126,7 @@ class KeySetABC(SetABC[T], _FrozenKeySetABC[K, T], Generic[K, T]):
     def __init__(self, objs: Iterable[T] = ()) -> None:
         """ Init """
         self.__key_to_obj = {self._key(obj): obj for obj in objs}
-        self.__key_fset = self._make_set(self._key_to_obj.keys())
+        self.__key_fset = self._make_set(self.__key_to_obj)
 
     @property
     def _key_to_obj(self) -> dict[K, T]:
@@ -214,6 +216,10 @@ class FrozenOrderedKeySetABC(FrozenKeySetABC[K, T], Generic[K, T]):
     def _make_fset(self, keys):
         return FrozenOrderedSet(keys)
 
+    def __iter__(self) -> Iterator[T]:
+        # The objects are stored in the same order as the keys (and never change)
+        return iter(self._key_to_obj.values())
+
 
 class OrderedKeySetABC(KeySetABC[K, T], Generic[K, T]):
 
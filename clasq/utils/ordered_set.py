@@ -13,7 +13,7 @@ class FrozenOrderedSet(FrozenSetABC[T], Generic[T]):
 
     def __init__(self, _iterable: Iterable[T] = ()) -> None:
         """ Init """
-        self._dict = {v: None for v in _iterable}
+        self._dict = dict.fromkeys(_iterable)  # Reuses the stored hashes if a dict is given
 
     def __contains__(self, val: T) -> bool:
         return val in self._dict
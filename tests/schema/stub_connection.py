@@ -0,0 +1,46 @@
+"""
+    Stub connection which records the statements instead of running them
+"""
+from clasq.connection.connection import ConnectionABC
+from clasq.utils.tabledata import TableData
+
+
+class StubConnection(ConnectionABC):
+    """ Connection which records `(stmt, prms)` of each statement
+        (Queries on information_schema return the given schema and version)
+    """
+
+    def __init__(self, schema_rows=(), version=(0, None), **cnx_options) -> None:
+        super().__init__(**cnx_options)
+        self.schema_rows = list(schema_rows)
+        self.version = version
+        self.runs: list = []
+
+    def _use_db(self, dbname) -> None:
+        pass
+
+    def run_stmt_prms(self, stmt, prms=()):
+        self.runs.append((stmt, list(prms)))
+        if b'information_schema.COLUMNS' in stmt:
+            if b'COUNT(*)' in stmt:
+                return TableData(['COUNT(*)', 'DIGEST'], [tuple(self.version)])
+            return TableData(['TABLE_NAME', 'COLUMN_NAME'], list(self.schema_rows))
+        return None
+
+    def run_stmt_many_prms(self, stmt, prms_list):
+        for prms in prms_list:
+            yield self.run_stmt_prms(stmt, prms)
+
+    def commit(self) -> None:
+        pass
+
+    def last_row_id(self) -> int:
+        return 0
+
+    def schema_queries(self) -> list:
+        """ Get the recorded queries on information_schema """
+        return [stmt for stmt, _ in self.runs if b'information_schema' in stmt]
+
+    def fetched_columns(self) -> list:
+        """ Get the recorded queries which fetch the columns (except the version queries) """
+        return [stmt for stmt in self.schema_queries() if b'COUNT(*)' not in stmt]
@@ -0,0 +1,143 @@
+"""
+    Test schema caches of Database
+"""
+import json
+import os
+import pytest
+
+from clasq.schema.abc import database as database_abc
+from clasq.schema.database import Database
+from clasq.schema.table import TableArgs
+from clasq.schema.column import ColumnArgs
+from clasq.schema.sqltypes import Int
+from stub_connection import StubConnection
+
+SCHEMA_ROWS = [('products', 'id'), ('products', 'name'), ('users', 'id')]
+
+
+def _con(version=(3, 12345678901234567890), **cnx_options):
+    return StubConnection(SCHEMA_ROWS, version=version, **{'host': 'localhost', 'user': 'u', **cnx_options})
+
+
+def test_schema_cache_file(tmp_path):
+    cache_path = str(tmp_path / 'schema.json')
+    db = Database('testdb', con=_con(), schema_cache_path=cache_path)
+    assert [t.get_raw_name() for t in db.all_tables] == [b'products', b'users']
+    assert os.listdir(tmp_path) == ['schema.json']
+
+    con = _con()
+    db = Database('testdb', con=con, schema_cache_path=cache_path)
+    assert [t.get_raw_name() for t in db.all_tables] == [b'products', b'users']
+    assert not con.fetched_columns()
+
+
+def test_schema_cache_file_json(tmp_path):
+    cache_path = tmp_path / 'schema.json'
+    Database('testdb', con=_con(), schema_cache_path=str(cache_path))
+    assert json.loads(cache_path.read_text()) == {
+        'header': {
+            'server': ['localhost', None, None, 'u'],
+            'database': 'testdb',
+            'version': ['3', '12345678901234567890'],
+        },
+        'tables': [['products', ['id', 'name']], ['users', ['id']]],
+    }
+
+
+def test_schema_cache_file_other_version(tmp_path):
+    cache_path = str(tmp_path / 'schema.json')
+    Database('testdb', con=_con(), schema_cache_path=cache_path)
+    con = _con(version=(3, 98765))
+    Database('testdb', con=con, schema_cache_path=cache_path)
+    assert len(con.fetched_columns()) == 1
+
+
+@pytest.mark.parametrize('cnx_options', [
+    {'host': 'otherhost'},
+    {'port': 3307},
+    {'unix_socket': '/tmp/mysql.sock'},
+    {'user': 'other'},
+])
+def test_schema_cache_file_other_server(tmp_path, cnx_options):
+    cache_path = str(tmp_path / 'schema.json')
+    Database('testdb', con=_con(), schema_cache_path=cache_path)
+    con = _con(**cnx_options)
+    Database('testdb', con=con, schema_cache_path=cache_path)
+    assert len(con.fetched_columns()) == 1
+
+
+@pytest.mark.parametrize('content', [b'', b'broken', b'\x80\x04K\x01.', b'{}', b'{"header": null}', b'[1, 2]'])
+def test_schema_cache_file_broken(tmp_path, content):
+    cache_path = tmp_path / 'schema.json'
+    cache_path.write_bytes(content)
+    con = _con()
+    db = Database('testdb', con=con, schema_cache_path=str(cache_path))
+    assert [t.get_raw_name() for t in db.all_tables] == [b'products', b'users']
+    assert len(con.fetched_columns()) == 1
+
+
+def test_schema_cache_file_not_writable(tmp_path):
+    cache_path = str(tmp_path / 'not_exists' / 'schema.json')
+    db = Database('testdb', con=_con(), schema_cache_path=cache_path)
+    assert [t.get_raw_name() for t in db.all_tables] == [b'products', b'users']
+    assert not os.path.exists(cache_path)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """ Empty schema memory cache and a clock advanced by hand """
+    now = [1000.0]
+    monkeypatch.setattr(database_abc, '_SCHEMA_MEMORY_CACHE', {})
+    monkeypatch.setattr(database_abc.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_schema_memory_cache(clock):
+    Database('testdb', con=_con(), schema_cache_ttl=60)
+    clock[0] += 59
+    con = _con()
+    db = Database('testdb', con=con, schema_cache_ttl=60)
+    assert [t.get_raw_name() for t in db.all_tables] == [b'products', b'users']
+    assert con.schema_queries() == []
+
+
+def test_schema_memory_cache_expired(clock):
+    Database('testdb', con=_con(), schema_cache_ttl=60)
+    clock[0] += 60
+    con = _con()
+    db = Database('testdb', con=con, schema_cache_ttl=60)
+    assert [t.get_raw_name() for t in db.all_tables] == [b'products', b'users']
+    assert len(con.fetched_columns()) == 1
+
+
+@pytest.mark.parametrize('db_name, cnx_options', [
+    ('otherdb', {}),
+    ('testdb', {'host': 'otherhost'}),
+    ('testdb', {'user': 'other'}),
+])
+def test_schema_memory_cache_other_database(clock, db_name, cnx_options):
+    Database('testdb', con=_con(), schema_cache_ttl=60)
+    con = _con(**cnx_options)
+    Database(db_name, con=con, schema_cache_ttl=60)
+    assert len(con.fetched_columns()) == 1
+
+
+@pytest.mark.parametrize('change', [
+    lambda db: db.append_table(TableArgs('orders', ColumnArgs('id', Int))).create(),
+    lambda db: db['products']._drop_on_db(),
+    lambda db: db['products'].drop(),
+])
+def test_schema_memory_cache_invalidated(clock, change):
+    change(Database('testdb', con=_con(), schema_cache_ttl=60))
+    con = _con()
+    Database('testdb', con=con, schema_cache_ttl=60)
+    assert len(con.fetched_columns()) == 1
+
+
+def test_schema_memory_cache_refresh(clock):
+    Database('testdb', con=_con(), schema_cache_ttl=60)
+    con = _con()
+    db = Database('testdb', con=con, schema_cache_ttl=60)
+    db.refresh_from_db()
+    assert [t.get_raw_name() for t in db.all_tables] == [b'products', b'users']
+    assert len(con.fetched_columns()) == 1
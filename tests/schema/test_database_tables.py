@@ -0,0 +1,44 @@
+"""
+    Test tables of Database
+"""
+import pytest
+
+from clasq.schema.database import Database
+from clasq.schema.table import TableArgs
+from clasq.schema.column import ColumnArgs
+from clasq.schema.sqltypes import Int
+from clasq.syntax.abc.object import ObjectName
+from clasq.syntax.errors import ObjectNotFoundError
+
+
+def _db():
+    return Database('testdb', TableArgs('t', ColumnArgs('a', Int)), TableArgs('u', ColumnArgs('b', Int)))
+
+
+@pytest.mark.parametrize('name', ['t', b't', ObjectName('t')])
+def test_get_table(name):
+    db = _db()
+    for _ in range(2):  # Second call uses the name cache
+        assert db.get_table(name).get_raw_name() == b't'
+        assert db[name] is db.get_table('t')
+        assert db._to_table(name) is db.get_table('t')
+    assert db[name, 'u'] == (db.get_table('t'), db.get_table('u'))
+
+
+@pytest.mark.parametrize('name', ['x', b'x', ObjectName('x')])
+def test_get_table_not_found(name):
+    with pytest.raises(ObjectNotFoundError):
+        _db().get_table(name)
+
+
+def test_get_table_invalid_type():
+    with pytest.raises(TypeError, match='Invalid type of value.'):
+        _db().get_table(bytearray(b't'))  # type: ignore
+
+
+@pytest.mark.parametrize('if_exists, expected', [(False, None), (True, (b'IF', b'EXISTS'))])
+def test_drop_database_query(if_exists, expected):
+    db = _db()
+    query = db._drop_database_query(if_exists=if_exists)
+    assert query == (b'DROP', b'DATABASE', expected, db)
+    assert db._drop_database_query(if_exists=if_exists) is query
@@ -65,3 +65,10 @@ def test_sqltype_name(cls: Type[SQLTypeABC], name: bytes, val: Any):
 
 
 
+
+
+def test_make_sql_type_cache():
+    assert sqt.make_sql_type(sqt.VarChar[Lt[32]]) is sqt.make_sql_type(sqt.VarChar[Lt[32]])
+    for i in range(1, 1000):
+        sqt.make_sql_type(sqt.VarChar[Lt[i]])  # type: ignore
+    assert sqt._make_sql_type_cached.cache_info().currsize <= sqt._make_sql_type_cached.cache_info().maxsize
@@ -0,0 +1,207 @@
+"""
+    Test queries of Table with TableData
+"""
+import pytest
+
+from clasq.schema.abc import table as table_abc
+from clasq.schema.database import Database
+from clasq.schema.table import Table, TableArgs
+from clasq.schema.column import ColumnArgs
+from clasq.schema.sqltypes import Int, VarBinary
+from clasq.syntax.errors import QueryTypeError
+from clasq.syntax.exprs import NoneExpr
+from clasq.utils.tabledata import TableData
+from stub_connection import StubConnection
+
+
+def _table():
+    con = StubConnection()
+    db = Database('testdb', TableArgs('t',
+        ColumnArgs('a', Int), ColumnArgs('b', Int), ColumnArgs('c', Int), ColumnArgs('d', VarBinary[16]),
+    ), con=con)
+    return db['t'], con
+
+
+@pytest.mark.parametrize('columns, rows, runs', [
+    (['a'], [(1,)], [(b'INSERT INTO `t` (`t`.`a`) VALUES (?)', [1])]),
+    (['a', 'b'], [(1, 2), (3, 4)], [(b'INSERT INTO `t` (`t`.`a`, `t`.`b`) VALUES (?, ?), (?, ?)', [1, 2, 3, 4])]),
+    (['c', 'a', 'b'], [(1, 2, 3), (4, 5, 6), (7, 8, 9)], [(
+        b'INSERT INTO `t` (`t`.`c`, `t`.`a`, `t`.`b`) VALUES (?, ?, ?), (?, ?, ?), (?, ?, ?)',
+        [1, 2, 3, 4, 5, 6, 7, 8, 9],
+    )]),
+])
+def test_insert_data(columns, rows, runs):
+    t, con = _table()
+    t.insert_data(TableData(columns, rows))
+    assert con.runs == runs
+
+
+def test_insert_data_chunks(monkeypatch):
+    monkeypatch.setattr(Table, 'DATA_ROWS_LIMIT', 2)
+    t, con = _table()
+    t.insert_data(TableData(['a', 'b'], [(1, 2), (3, 4), (5, 6), (7, 8), (9, 10)]))
+    assert con.runs == [
+        (b'INSERT INTO `t` (`t`.`a`, `t`.`b`) VALUES (?, ?), (?, ?)', [1, 2, 3, 4]),
+        (b'INSERT INTO `t` (`t`.`a`, `t`.`b`) VALUES (?, ?), (?, ?)', [5, 6, 7, 8]),
+        (b'INSERT INTO `t` (`t`.`a`, `t`.`b`) VALUES (?, ?)', [9, 10]),
+    ]
+    # Only the queries of full chunks are cached
+    col_ids = (t['a'].column_id, t['b'].column_id)
+    assert (b'INSERT', 2, col_ids) in t._query_cache
+    assert (b'INSERT', 1, col_ids) not in t._query_cache
+
+
+def test_insert_data_placeholders(monkeypatch):
+    monkeypatch.setattr(table_abc, '_MAX_PLACEHOLDERS', 5)
+    t, con = _table()
+    t.insert_data(TableData(['a', 'b'], [(1, 2), (3, 4), (5, 6)]))
+    assert con.runs == [
+        (b'INSERT INTO `t` (`t`.`a`, `t`.`b`) VALUES (?, ?), (?, ?)', [1, 2, 3, 4]),
+        (b'INSERT INTO `t` (`t`.`a`, `t`.`b`) VALUES (?, ?)', [5, 6]),
+    ]
+
+
+@pytest.mark.parametrize('n_rows, n_cols, sizes', [
+    (2500, 3, [1000, 1000, 500]),
+    (1000, 66, [992, 8]),
+    (5, 70000, [1] * 5),
+])
+def test_data_row_chunks(n_rows, n_cols, sizes):
+    t, _ = _table()
+    chunks = list(t._iter_data_row_chunks(list(range(n_rows)), n_cols))
+    assert [len(chunk) for chunk, _ in chunks] == sizes
+    assert [is_full for _, is_full in chunks] == [size == sizes[0] for size in sizes]
+
+
+@pytest.mark.parametrize('columns, rows, keys, runs', [
+    (['a', 'c'], [(1, 10), (2, 20)], ['a'], [(
+        b'UPDATE `t` INNER JOIN (SELECT ? AS `a`, ? AS `c` UNION ALL SELECT ?, ?) AS `t_data`'
+        b' ON `t`.`a` = `t_data`.`a` SET `t`.`c` = `t_data`.`c`',
+        [1, 10, 2, 20],
+    )]),
+    (['c', 'a'], [(10, 1)], ['a'], [(
+        b'UPDATE `t` INNER JOIN (SELECT ? AS `a`, ? AS `c`) AS `t_data`'
+        b' ON `t`.`a` = `t_data`.`a` SET `t`.`c` = `t_data`.`c`',
+        [1, 10],
+    )]),
+    (['a', 'b', 'c'], [(1, 2, 10), (3, 4, 20)], ['a', 'b'], [(
+        b'UPDATE `t` INNER JOIN (SELECT ? AS `a`, ? AS `b`, ? AS `c` UNION ALL SELECT ?, ?, ?) AS `t_data`'
+        b' ON `t`.`a` = `t_data`.`a` AND `t`.`b` = `t_data`.`b` SET `t`.`c` = `t_data`.`c`',
+        [1, 2, 10, 3, 4, 20],
+    )]),
+    (['a', 'b', 'c'], [(1, 10, 100)], ['a'], [(
+        b'UPDATE `t` INNER JOIN (SELECT ? AS `a`, ? AS `b`, ? AS `c`) AS `t_data`'
+        b' ON `t`.`a` = `t_data`.`a` SET `t`.`b` = `t_data`.`b`, `t`.`c` = `t_data`.`c`',
+        [1, 10, 100],
+    )]),
+    (['a', 'c'], [(1, 10), (2, 20), (1, 30)], ['a'], [(
+        b'UPDATE `t` INNER JOIN (SELECT ? AS `a`, ? AS `c` UNION ALL SELECT ?, ?) AS `t_data`'
+        b' ON `t`.`a` = `t_data`.`a` SET `t`.`c` = `t_data`.`c`',
+        [1, 30, 2, 20],
+    )]),
+    (['d', 'c'], [(bytearray(b'x'), 10), (b'x', 20)], ['d'], [(
+        b'UPDATE `t` INNER JOIN (SELECT ? AS `d`, ? AS `c`) AS `t_data`'
+        b' ON `t`.`d` = `t_data`.`d` SET `t`.`c` = `t_data`.`c`',
+        [b'x', 20],
+    )]),
+])
+def test_update_data(columns, rows, keys, runs):
+    t, con = _table()
+    t.update_data(TableData(columns, rows), keys=keys)
+    assert con.runs == runs
+
+
+def test_update_data_chunks(monkeypatch):
+    monkeypatch.setattr(Table, 'DATA_ROWS_LIMIT', 2)
+    t, con = _table()
+    t.update_data(TableData(['a', 'c'], [(1, 10), (2, 20), (3, 30)]), keys=['a'])
+    assert con.runs == [
+        (
+            b'UPDATE `t` INNER JOIN (SELECT ? AS `a`, ? AS `c` UNION ALL SELECT ?, ?) AS `t_data`'
+            b' ON `t`.`a` = `t_data`.`a` SET `t`.`c` = `t_data`.`c`',
+            [1, 10, 2, 20],
+        ),
+        (
+            b'UPDATE `t` INNER JOIN (SELECT ? AS `a`, ? AS `c`) AS `t_data`'
+            b' ON `t`.`a` = `t_data`.`a` SET `t`.`c` = `t_data`.`c`',
+            [3, 30],
+        ),
+    ]
+    # Only the queries of full chunks are cached
+    col_ids = ((t['a'].column_id,), (t['c'].column_id,))
+    assert (b'UPDATE', 2, *col_ids) in t._query_cache
+    assert (b'UPDATE', 1, *col_ids) not in t._query_cache
+
+
+@pytest.mark.parametrize('columns, keys, message', [
+    (['a', 'c'], ['b'], 'Invalid key values.'),
+    (['a', 'c'], ['a', 'b'], 'Invalid key values.'),
+    (['a'], ['a'], 'Both key and non-key columns are required.'),
+    (['a', 'c'], [], 'Both key and non-key columns are required.'),
+])
+def test_update_data_error(columns, keys, message):
+    t, con = _table()
+    with pytest.raises(ValueError, match=message):
+        t.update_data(TableData(columns, [(1, 2)[:len(columns)]]), keys=keys)
+    assert con.runs == []
+
+
+@pytest.mark.parametrize('columns, rows, runs', [
+    (['a'], [(1,), (2,)], [(b'DELETE FROM `t` WHERE (`t`.`a`) IN ((?), (?))', [1, 2])]),
+    (['a', 'b'], [(1, 2), (3, 4)], [(b'DELETE FROM `t` WHERE (`t`.`a`, `t`.`b`) IN ((?, ?), (?, ?))', [1, 2, 3, 4])]),
+])
+def test_delete_data(columns, rows, runs):
+    t, con = _table()
+    t.delete_data(TableData(columns, rows))
+    assert con.runs == runs
+
+
+def test_delete_data_chunks(monkeypatch):
+    monkeypatch.setattr(Table, 'DATA_ROWS_LIMIT', 2)
+    t, con = _table()
+    t.delete_data(TableData(['a', 'b'], [(1, 2), (3, 4), (5, 6)]))
+    assert con.runs == [
+        (b'DELETE FROM `t` WHERE (`t`.`a`, `t`.`b`) IN ((?, ?), (?, ?))', [1, 2, 3, 4]),
+        (b'DELETE FROM `t` WHERE (`t`.`a`, `t`.`b`) IN ((?, ?))', [5, 6]),
+    ]
+
+
+@pytest.mark.parametrize('where, runs', [
+    (None, [(b'UPDATE `t` SET `t`.`c` = ?', [1])]),
+    (NoneExpr, [(b'UPDATE `t` SET `t`.`c` = ?', [1])]),
+])
+def test_update_without_where(where, runs):
+    t, con = _table()
+    t.update(c=1, where=where)
+    assert con.runs == runs
+
+
+@pytest.mark.parametrize('where, runs', [
+    (None, [(b'DELETE FROM `t`', [])]),
+    (NoneExpr, [(b'DELETE FROM `t`', [])]),
+])
+def test_delete_without_where(where, runs):
+    t, con = _table()
+    t.delete(where=where)
+    assert con.runs == runs
+
+
+def test_delete_where():
+    t, con = _table()
+    t.delete(where=t['a'] == 1)
+    assert con.runs == [(b'DELETE FROM `t` WHERE (`t`.`a` = ?)', [1])]
+
+
+def test_drop_if_exists_twice():
+    t, con = _table()
+    t._drop_on_db(if_exists=True)
+    t._drop_on_db(if_exists=True)
+    assert con.runs == [(b'DROP TABLE IF EXISTS `t`', [])] * 2
+    assert t._exists_on_db is False
+
+
+def test_insert_data_invalid_type():
+    t, con = _table()
+    with pytest.raises(QueryTypeError):
+        t.insert_data(TableData(['a', 'b'], [(1, {'x': 2})]))
+    assert con.runs == []
@@ -0,0 +1,29 @@
+"""
+    Test cloning views
+"""
+import pytest
+
+from clasq.schema.database import Database
+from clasq.schema.table import TableArgs
+from clasq.schema.column import ColumnArgs
+from clasq.schema.sqltypes import Int
+
+
+def _view():
+    db = Database('testdb', TableArgs('t', ColumnArgs('a', Int), ColumnArgs('b', Int)))
+    t = db['t']
+    return t.where(t['a'] == 1)
+
+
+@pytest.mark.parametrize('clone', [
+    lambda v: v.clone(),
+    lambda v: v.where(),
+    lambda v: v.group_by(),
+    lambda v: v.order_by(),
+])
+def test_clone_without_changes(clone):
+    v = _view()
+    new_v = clone(v)
+    assert new_v is not v
+    assert new_v._select_query.stmt == v._select_query.stmt
+    assert new_v._select_query.prms == v._select_query.prms
@@ -5,9 +5,10 @@
 from math import ceil, floor, trunc
 import pytest
 
-from clasq.syntax.exprs import ExprObject as Obj
+from clasq.syntax.exprs import Arg, ExprObject as Obj
 from clasq.syntax.query_data import QueryData
 from clasq.syntax.values import NULL
+from clasq.syntax import errors
 
 @pytest.mark.parametrize('term, result', [
     [Obj(b'expr') == NULL , (b'(`expr` = NULL)' , [])],
@@ -78,3 +79,40 @@ def test_query_data(args, result):
     true_stmt, true_prms = result
     assert qd.stmt == true_stmt and qd.prms == tuple(true_prms)
 
+
+
+@pytest.mark.parametrize('args, columns, rows', [
+    [(b'hoge', [Arg('a'), Arg('b')]), ('a', 'b'), [(1, 'x'), (2, 'y')]],
+    [(b'hoge', [Arg('b'), 123, Arg('a')]), ('a', 'b'), [(1, 'x'), (2, NULL)]],
+    [(b'hoge', [Arg('a'), Arg('c', default=5)]), ('a',), [(1,), (2,)]],
+    [(b'hoge', [Arg('a'), Arg('a')]), ('a',), []],
+])
+def test_calc_prms_many_rows(args, columns, rows):
+    qd = QueryData(*args)
+    assert list(qd.calc_prms_many_rows(columns, rows)) == list(qd.calc_prms_many(dict(zip(columns, row)) for row in rows))
+
+
+@pytest.mark.parametrize('args, argvals', [
+    [(b'hoge', [Arg(0), Arg(1)]), (1, 'x')],
+    [(b'hoge', [Arg(1), 123, Arg(0)]), (1, NULL)],
+    [(b'hoge', [(b'(', Arg(0), b')'), (b'(', Arg(1), b')'), (b'(', Arg(0), b')')]), (1, 2)],
+    [(b'hoge', QueryData(b'(', [Arg(0), Arg(1)], b')')), (1, 2)],
+])
+def test_call_positional(args, argvals):
+    qd = QueryData(*args)
+    assert qd.call_positional(argvals) == qd.call(*argvals)
+    assert qd.call_positional(argvals).prms == qd.call(*argvals).prms
+
+
+@pytest.mark.parametrize('argvals', [
+    ({'x': 1}, 2),
+    (1, object()),
+    (1, [2]),
+])
+def test_call_positional_invalid_type(argvals):
+    with pytest.raises(errors.QueryTypeError):
+        QueryData(b'hoge', [Arg(0), Arg(1)]).call_positional(argvals)
+
+
+def test_call_positional_none():
+    assert QueryData(b'hoge', [Arg(0), Arg(1)]).call_positional((None, 1)).prms == (None, 1)